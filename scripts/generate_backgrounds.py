@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Generate royalty-free gradient backgrounds for wavevid."""
-from PIL import Image, ImageDraw
+from PIL import Image
+import hashlib
+import json
 import math
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 OUTPUT_DIR = Path(__file__).parent.parent / "src/wavevid/backgrounds"
+CACHE_FILE = OUTPUT_DIR / ".cache.json"
 WIDTH, HEIGHT = 1920, 1080
 
 GRADIENTS = [
@@ -27,89 +33,122 @@ def hex_to_rgb(hex_color: str) -> tuple:
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
-def interpolate_color(color1: tuple, color2: tuple, t: float) -> tuple:
-    return tuple(int(c1 + (c2 - c1) * t) for c1, c2 in zip(color1, color2))
-
+# Palettes parsed once at import; the create_* functions take (K, 3) float arrays
+GRADIENTS_RGB = [
+    (name, np.array([hex_to_rgb(c) for c in colors], dtype=np.float32), style)
+    for name, colors, style in GRADIENTS
+]
 
-def create_vertical_gradient(colors: list[str]) -> Image.Image:
-    img = Image.new('RGB', (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(img)
-    rgb_colors = [hex_to_rgb(c) for c in colors]
 
-    segments = len(rgb_colors) - 1
+def create_vertical_gradient(rgb: np.ndarray) -> Image.Image:
+    segments = len(rgb) - 1
     segment_height = HEIGHT / segments
 
-    for y in range(HEIGHT):
-        segment = min(int(y / segment_height), segments - 1)
-        t = (y - segment * segment_height) / segment_height
-        color = interpolate_color(rgb_colors[segment], rgb_colors[segment + 1], t)
-        draw.line([(0, y), (WIDTH, y)], fill=color)
-
-    return img
+    # Per-row segment index and position within it, computed for all rows at once
+    ys = np.arange(HEIGHT, dtype=np.float32)
+    seg_idx = np.minimum((ys / segment_height).astype(np.intp), segments - 1)
+    t = (ys - seg_idx * segment_height) / segment_height
 
+    column = rgb[seg_idx] + (rgb[seg_idx + 1] - rgb[seg_idx]) * t[:, None]
+    arr = np.broadcast_to(column[:, None, :], (HEIGHT, WIDTH, 3)).astype(np.uint8)
+    return Image.fromarray(arr, 'RGB')
 
-def create_diagonal_gradient(colors: list[str]) -> Image.Image:
-    img = Image.new('RGB', (WIDTH, HEIGHT))
-    rgb_colors = [hex_to_rgb(c) for c in colors]
 
-    if len(rgb_colors) == 2:
-        c1, c2 = rgb_colors
-    else:
-        c1, c2 = rgb_colors[0], rgb_colors[-1]
+def create_diagonal_gradient(rgb: np.ndarray) -> Image.Image:
+    c1, c2 = rgb[0], rgb[-1]
 
     max_dist = WIDTH + HEIGHT
 
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            t = (x + y) / max_dist
-            color = interpolate_color(c1, c2, t)
-            img.putpixel((x, y), color)
-
-    return img
+    # t = (x + y) / max_dist as an outer sum over columns and rows
+    xs = np.arange(WIDTH, dtype=np.float32)
+    ys = np.arange(HEIGHT, dtype=np.float32)
+    t = ((xs[None, :] + ys[:, None]) / max_dist)[..., None]
 
+    arr = (c1 + (c2 - c1) * t).astype(np.uint8)
+    return Image.fromarray(arr, 'RGB')
 
-def create_radial_gradient(colors: list[str]) -> Image.Image:
-    img = Image.new('RGB', (WIDTH, HEIGHT))
-    rgb_colors = [hex_to_rgb(c) for c in colors]
 
-    if len(rgb_colors) == 2:
-        inner, outer = rgb_colors
+def create_radial_gradient(rgb: np.ndarray) -> Image.Image:
+    if len(rgb) == 2:
+        inner, outer = rgb
     else:
-        inner, outer = rgb_colors[-1], rgb_colors[0]
+        inner, outer = rgb[-1], rgb[0]
 
     cx, cy = WIDTH // 2, HEIGHT // 2
     max_dist = math.sqrt(cx**2 + cy**2)
 
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            dist = math.sqrt((x - cx)**2 + (y - cy)**2)
-            t = min(dist / max_dist, 1.0)
-            color = interpolate_color(inner, outer, t)
-            img.putpixel((x, y), color)
+    # Distance field from broadcast offsets, one sqrt over the whole array
+    xs = np.arange(WIDTH, dtype=np.float32) - cx
+    ys = np.arange(HEIGHT, dtype=np.float32) - cy
+    d = np.sqrt(xs[None, :] ** 2 + ys[:, None] ** 2) / max_dist
+    np.clip(d, 0, 1, out=d)
+    t = d[..., None]
 
-    return img
+    arr = (inner + (outer - inner) * t).astype(np.uint8)
+    return Image.fromarray(arr, 'RGB')
 
 
-def main():
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+def gradient_key(name: str, colors: list[str], style: str) -> str:
+    """Hash of everything that affects a generated background."""
+    return hashlib.sha1(json.dumps([name, colors, style, WIDTH, HEIGHT]).encode()).hexdigest()
 
-    for name, colors, style in GRADIENTS:
-        print(f"Generating {name} ({style})...")
 
-        if style == "vertical":
-            img = create_vertical_gradient(colors)
-        elif style == "diagonal":
-            img = create_diagonal_gradient(colors)
-        elif style == "radial":
-            img = create_radial_gradient(colors)
-        else:
-            img = create_vertical_gradient(colors)
+def load_cache() -> dict:
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict):
+    # Write to a temp file and rename so an interrupted run never leaves a partial map
+    tmp_path = CACHE_FILE.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    os.replace(tmp_path, CACHE_FILE)
 
-        output_path = OUTPUT_DIR / f"{name}.jpg"
-        img.save(output_path, "JPEG", quality=90)
-        print(f"  Saved: {output_path}")
 
-    print(f"\nGenerated {len(GRADIENTS)} backgrounds in {OUTPUT_DIR}")
+def render_one(gradient: tuple[str, np.ndarray, str]) -> Path:
+    """Render and save a single background. Runs in a worker process."""
+    name, rgb, style = gradient
+
+    if style == "vertical":
+        img = create_vertical_gradient(rgb)
+    elif style == "diagonal":
+        img = create_diagonal_gradient(rgb)
+    elif style == "radial":
+        img = create_radial_gradient(rgb)
+    else:
+        img = create_vertical_gradient(rgb)
+
+    output_path = OUTPUT_DIR / f"{name}.jpg"
+    img.save(output_path, "JPEG", quality=90)
+    return output_path
+
+
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    cache = load_cache()
+
+    pending = []
+    keys = []
+    for (name, colors, style), gradient in zip(GRADIENTS, GRADIENTS_RGB):
+        key = gradient_key(name, colors, style)
+        output_path = OUTPUT_DIR / f"{name}.jpg"
+        if output_path.exists() and cache.get(name) == key:
+            print(f"Skipping {name} (up to date)")
+        else:
+            print(f"Generating {name} ({style})...")
+            pending.append(gradient)
+            keys.append(key)
+
+    # Backgrounds are independent, so render them across all cores
+    with ProcessPoolExecutor() as executor:
+        for (name, _, _), key, output_path in zip(pending, keys, executor.map(render_one, pending)):
+            cache[name] = key
+            save_cache(cache)
+            print(f"  Saved: {output_path}")
+
+    print(f"\nGenerated {len(pending)} of {len(GRADIENTS)} backgrounds in {OUTPUT_DIR}")
 
 
 if __name__ == "__main__":
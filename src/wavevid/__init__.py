@@ -1,2 +1,2 @@
 """Audio to waveform video generator."""
-__version__ = "0.1.0"
+__version__ = "0.1.1"
@@ -1,10 +1,12 @@
 """Modular animation system for wavevid elements."""
 from dataclasses import dataclass
 from typing import Callable
+import bisect
 import math
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnimationState:
     """State passed to drawing functions."""
     opacity: float = 1.0      # 0.0 to 1.0
@@ -68,6 +70,49 @@ EASINGS = {
 }
 
 
+# Array variants for baking whole timelines. Polynomial easings already
+# work on ndarrays; only the branching ones need their own version.
+def ease_in_out_quad_vec(t: np.ndarray) -> np.ndarray:
+    return np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+
+def ease_out_elastic_vec(t: np.ndarray) -> np.ndarray:
+    out = np.power(2.0, -10 * t) * np.sin((t * 10 - 0.75) * (2 * math.pi) / 3) + 1
+    return np.where((t == 0) | (t == 1), t, out)
+
+
+EASINGS_VEC = {
+    **EASINGS,
+    'in_out_quad': ease_in_out_quad_vec,
+    'out_elastic': ease_out_elastic_vec,
+}
+
+
+def baked_arrays(n: int, **values) -> dict[str, np.ndarray]:
+    """Full set of baked state arrays, identity state unless overridden."""
+    arrays = {
+        'opacity': np.ones(n),
+        'scale': np.ones(n),
+        'offset_x': np.zeros(n),
+        'offset_y': np.zeros(n),
+        'visible_chars': np.full(n, -1, dtype=np.int64),
+    }
+    for key, value in values.items():
+        arrays[key] = np.broadcast_to(value, n).astype(arrays[key].dtype)
+    return arrays
+
+
+def merge_baked(a: dict, b: dict) -> dict[str, np.ndarray]:
+    """Array version of AnimationState.merge."""
+    va, vb = a['visible_chars'], b['visible_chars']
+    return {
+        'opacity': a['opacity'] * b['opacity'],
+        'scale': a['scale'] * b['scale'],
+        'offset_x': a['offset_x'] + b['offset_x'],
+        'offset_y': a['offset_y'] + b['offset_y'],
+        'visible_chars': np.where((va >= 0) & (vb >= 0), np.minimum(va, vb), np.maximum(va, vb)),
+    }
+
+
 class Animation:
     """Base animation class."""
 
@@ -75,18 +120,49 @@ class Animation:
         self.duration = duration
         self.delay = delay
         self.easing_fn = EASINGS.get(easing, ease_out_quad)
+        self.easing_vec = EASINGS_VEC.get(easing, ease_out_quad)
+        # Precomputed so the per-frame path multiplies instead of divides
+        self._inv_duration = 1.0 / duration if duration > 0 else 0.0
+        self._baked = None
 
     def get_state(self, time: float, fps: int) -> AnimationState:
         """Get animation state at given time (seconds)."""
-        if time < self.delay:
+        elapsed = time - self.delay
+        if elapsed < 0:
             return self._get_start_state()
 
-        elapsed = time - self.delay
         if elapsed >= self.duration:
             return self._get_end_state()
 
-        progress = self.easing_fn(elapsed / self.duration)
-        return self._interpolate(progress)
+        return self._interpolate(self.easing_fn(elapsed * self._inv_duration))
+
+    def bake(self, n_frames: int, fps: int) -> dict[str, np.ndarray]:
+        """Precompute states for frames 0..n_frames-1 as arrays (cached)."""
+        if self._baked is None or self._baked[0] != (n_frames, fps):
+            self._baked = ((n_frames, fps), self._bake_times(np.arange(n_frames) / fps))
+        return self._baked[1]
+
+    def state_at(self, frame_idx: int, fps: int) -> AnimationState:
+        """Get state for a frame, reading the baked timeline when available."""
+        if self._baked is not None:
+            (n_frames, baked_fps), arrays = self._baked
+            if baked_fps == fps and 0 <= frame_idx < n_frames:
+                return AnimationState(
+                    opacity=float(arrays['opacity'][frame_idx]),
+                    scale=float(arrays['scale'][frame_idx]),
+                    offset_x=float(arrays['offset_x'][frame_idx]),
+                    offset_y=float(arrays['offset_y'][frame_idx]),
+                    visible_chars=int(arrays['visible_chars'][frame_idx]),
+                )
+        return self.get_state(frame_idx / fps, fps)
+
+    def _bake_times(self, times: np.ndarray) -> dict[str, np.ndarray]:
+        """Vectorized get_state over an array of times."""
+        if self.duration > 0:
+            progress = np.clip((times - self.delay) * self._inv_duration, 0.0, 1.0)
+        else:
+            progress = (times >= self.delay).astype(float)
+        return baked_arrays(len(times), **self._interpolate_array(self.easing_vec(progress)))
 
     def _get_start_state(self) -> AnimationState:
         return AnimationState()
@@ -97,6 +173,9 @@ class Animation:
     def _interpolate(self, progress: float) -> AnimationState:
         return AnimationState()
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {}
+
     def total_duration(self) -> float:
         return self.delay + self.duration
 
@@ -116,6 +195,9 @@ class FadeIn(Animation):
     def _interpolate(self, progress: float) -> AnimationState:
         return AnimationState(opacity=progress)
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'opacity': progress}
+
 
 class FadeOut(Animation):
     """Fade from opaque to transparent."""
@@ -132,6 +214,9 @@ class FadeOut(Animation):
     def _interpolate(self, progress: float) -> AnimationState:
         return AnimationState(opacity=1.0 - progress)
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'opacity': 1.0 - progress}
+
 
 class ScaleDown(Animation):
     """Scale from larger to normal size."""
@@ -152,6 +237,9 @@ class ScaleDown(Animation):
         scale = self.start_scale + (self.end_scale - self.start_scale) * progress
         return AnimationState(scale=scale)
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'scale': self.start_scale + (self.end_scale - self.start_scale) * progress}
+
 
 class ScaleUp(Animation):
     """Scale from smaller to normal size."""
@@ -172,6 +260,9 @@ class ScaleUp(Animation):
         scale = self.start_scale + (self.end_scale - self.start_scale) * progress
         return AnimationState(scale=scale)
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'scale': self.start_scale + (self.end_scale - self.start_scale) * progress}
+
 
 class SlideUp(Animation):
     """Slide from below into position."""
@@ -190,6 +281,9 @@ class SlideUp(Animation):
     def _interpolate(self, progress: float) -> AnimationState:
         return AnimationState(offset_y=self.distance * (1 - progress))
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'offset_y': self.distance * (1 - progress)}
+
 
 class SlideDown(Animation):
     """Slide from above into position."""
@@ -208,6 +302,9 @@ class SlideDown(Animation):
     def _interpolate(self, progress: float) -> AnimationState:
         return AnimationState(offset_y=-self.distance * (1 - progress))
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'offset_y': -self.distance * (1 - progress)}
+
 
 class Typewriter(Animation):
     """Reveal characters one by one."""
@@ -227,6 +324,9 @@ class Typewriter(Animation):
         chars = int(self.total_chars * progress)
         return AnimationState(visible_chars=chars)
 
+    def _interpolate_array(self, progress: np.ndarray) -> dict[str, np.ndarray]:
+        return {'visible_chars': (self.total_chars * progress).astype(np.int64)}
+
 
 class Parallel(Animation):
     """Run multiple animations simultaneously."""
@@ -237,11 +337,20 @@ class Parallel(Animation):
         super().__init__(max_duration, 0, 'linear')
 
     def get_state(self, time: float, fps: int) -> AnimationState:
-        state = AnimationState()
-        for anim in self.animations:
+        animations = self.animations
+        if not animations:
+            return AnimationState()
+        state = animations[0].get_state(time, fps)
+        for anim in animations[1:]:
             state = state.merge(anim.get_state(time, fps))
         return state
 
+    def _bake_times(self, times: np.ndarray) -> dict[str, np.ndarray]:
+        arrays = baked_arrays(len(times))
+        for anim in self.animations:
+            arrays = merge_baked(arrays, anim._bake_times(times))
+        return arrays
+
     def total_duration(self) -> float:
         return max(a.total_duration() for a in self.animations) if self.animations else 0
 
@@ -251,23 +360,38 @@ class Sequential(Animation):
 
     def __init__(self, *animations: Animation):
         self.animations = animations
-        total = sum(a.total_duration() for a in animations)
-        super().__init__(total, 0, 'linear')
+        # Start time of each child, plus the overall end time
+        self._cum = [0.0]
+        for a in animations:
+            self._cum.append(self._cum[-1] + a.total_duration())
+        super().__init__(self._cum[-1], 0, 'linear')
 
     def get_state(self, time: float, fps: int) -> AnimationState:
-        elapsed = 0
-        for anim in self.animations:
-            anim_duration = anim.total_duration()
-            if time < elapsed + anim_duration:
-                return anim.get_state(time - elapsed, fps)
-            elapsed += anim_duration
-        # Return final state of last animation
-        if self.animations:
+        if not self.animations:
+            return AnimationState()
+        idx = max(bisect.bisect_right(self._cum, time) - 1, 0)
+        if idx >= len(self.animations):
+            # Return final state of last animation
             return self.animations[-1]._get_end_state()
-        return AnimationState()
+        return self.animations[idx].get_state(time - self._cum[idx], fps)
+
+    def _bake_times(self, times: np.ndarray) -> dict[str, np.ndarray]:
+        # Past the end: final state of last animation
+        if self.animations:
+            end = self.animations[-1]._get_end_state()
+            arrays = baked_arrays(len(times), opacity=end.opacity, scale=end.scale, offset_x=end.offset_x,
+                                  offset_y=end.offset_y, visible_chars=end.visible_chars)
+        else:
+            arrays = baked_arrays(len(times))
+        for anim, start, end in zip(self.animations, self._cum, self._cum[1:]):
+            mask = (times >= start) & (times < end)
+            if mask.any():
+                for key, values in anim._bake_times(times[mask] - start).items():
+                    arrays[key][mask] = values
+        return arrays
 
     def total_duration(self) -> float:
-        return sum(a.total_duration() for a in self.animations)
+        return self._cum[-1]
 
 
 class Delay(Animation):
@@ -279,6 +403,9 @@ class Delay(Animation):
     def get_state(self, time: float, fps: int) -> AnimationState:
         return AnimationState()
 
+    def _bake_times(self, times: np.ndarray) -> dict[str, np.ndarray]:
+        return baked_arrays(len(times))
+
 
 class NoAnimation(Animation):
     """No animation - static state."""
@@ -289,6 +416,9 @@ class NoAnimation(Animation):
     def get_state(self, time: float, fps: int) -> AnimationState:
         return AnimationState()
 
+    def _bake_times(self, times: np.ndarray) -> dict[str, np.ndarray]:
+        return baked_arrays(len(times))
+
 
 # Preset animation combinations
 def intro_title_animation(title_duration: float = 1.0, subtitle_delay: float = 0.5,
@@ -1,7 +1,10 @@
 """Background generators."""
+from functools import lru_cache
 from PIL import Image
+import hashlib
 import numpy as np
-import colorsys
+import warnings
+from scipy.cluster.vq import kmeans2
 
 
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
@@ -22,18 +25,11 @@ def create_gradient_background(width: int, height: int, colors: str) -> Image.Im
     rgb1 = hex_to_rgb(color1.strip())
     rgb2 = hex_to_rgb(color2.strip())
 
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-
-    for y in range(height):
-        ratio = y / height
-        r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-        g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-        b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-        for x in range(width):
-            pixels[x, y] = (r, g, b)
-
-    return img
+    # One color per row, broadcast across the width
+    ratio = (np.arange(height) / height)[:, None]
+    rgb = (np.array(rgb1) * (1 - ratio) + np.array(rgb2) * ratio).astype(np.uint8)
+    arr = np.broadcast_to(rgb[:, None, :], (height, width, 3)).copy()
+    return Image.fromarray(arr, 'RGB')
 
 
 def create_image_background(width: int, height: int, path: str) -> Image.Image:
@@ -74,26 +70,82 @@ def get_luminance(r: int, g: int, b: int) -> float:
     return (0.299 * r + 0.587 * g + 0.114 * b) / 255
 
 
+def get_mean_luminance(pixels: np.ndarray) -> float:
+    """Average relative luminance (0-1) of an (N, 3) RGB pixel array."""
+    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return float((pixels.astype(np.float32) @ weights).mean() / 255)
+
+
+def rgb_to_hsv_np(rgb: np.ndarray) -> np.ndarray:
+    """Vectorized colorsys.rgb_to_hsv for an (N, 3) array of 0-1 floats."""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    delta = maxc - minc
+    s = np.where(maxc > 0, delta / np.where(maxc > 0, maxc, 1), 0.0)
+
+    safe_delta = np.where(delta > 0, delta, 1)
+    rc = (maxc - r) / safe_delta
+    gc = (maxc - g) / safe_delta
+    bc = (maxc - b) / safe_delta
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(delta > 0, (h / 6.0) % 1.0, 0.0)
+    return np.stack([h, s, maxc], axis=1)
+
+
+def hsv_to_rgb_np(hsv: np.ndarray) -> np.ndarray:
+    """Vectorized colorsys.hsv_to_rgb for an (N, 3) array of 0-1 floats."""
+    h, s, v = hsv[:, 0], hsv[:, 1], hsv[:, 2]
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i.astype(int) % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return np.stack([r, g, b], axis=1)
+
+
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB to hex color."""
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
-def calculate_auto_subtitle_color(background: Image.Image) -> str:
+def _as_rgb_array(background: Image.Image | np.ndarray) -> np.ndarray:
+    """View a background as an (H, W, 3) uint8 array, converting PIL images once."""
+    if isinstance(background, Image.Image):
+        background = np.asarray(background)
+    return background[..., :3]
+
+
+def _block_mean(region: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Downsample a region to rows x cols uint8 pixels, each the mean of its block.
+
+    Averaging (rather than picking one pixel per block) keeps fine texture
+    from aliasing into the sample. Edge pixels that do not fill a whole
+    block are dropped.
+    """
+    rows = min(rows, region.shape[0])
+    cols = min(cols, region.shape[1])
+    by, bx = region.shape[0] // rows, region.shape[1] // cols
+    blocks = region[:rows * by, :cols * bx].reshape(rows, by, cols, bx, 3)
+    return (blocks.mean(axis=(1, 3)) + 0.5).astype(np.uint8)
+
+
+def calculate_auto_subtitle_color(background: Image.Image | np.ndarray) -> str:
     """
     Calculate optimal subtitle color based on background bottom region.
     Subtitles appear at bottom, so we analyze that area.
     Returns white or black based on luminance for best readability.
     """
-    width, height = background.size
+    bg_arr = _as_rgb_array(background)
+    height = bg_arr.shape[0]
 
     # Sample bottom 20% where subtitles appear
-    bottom_region = background.crop((0, int(height * 0.8), width, height))
-    sample = bottom_region.resize((100, 20), Image.Resampling.NEAREST)
-    pixels = np.array(sample).reshape(-1, 3)
-
-    # Calculate average luminance
-    avg_luminance = np.mean([get_luminance(p[0], p[1], p[2]) for p in pixels])
+    bottom_region = bg_arr[int(height * 0.8):]
+    avg_luminance = get_mean_luminance(bottom_region.reshape(-1, 3))
 
     # Simple: white text on dark, black text on light
     # But for video, white with dark bg box usually works best
@@ -104,23 +156,20 @@ def calculate_auto_subtitle_color(background: Image.Image) -> str:
         return '#1a1a1a'  # Near-black on light
 
 
-def calculate_auto_title_color(background: Image.Image) -> str:
+def calculate_auto_title_color(background: Image.Image | np.ndarray) -> str:
     """
     Calculate optimal title color based on background center region.
     Title appears centered, so we analyze the center area.
     Returns white or near-black based on luminance for best readability.
     """
-    width, height = background.size
+    bg_arr = _as_rgb_array(background)
+    height, width = bg_arr.shape[:2]
 
     # Sample center 60% where title appears
     margin_x = int(width * 0.2)
     margin_y = int(height * 0.2)
-    center_region = background.crop((margin_x, margin_y, width - margin_x, height - margin_y))
-    sample = center_region.resize((100, 100), Image.Resampling.NEAREST)
-    pixels = np.array(sample).reshape(-1, 3)
-
-    # Calculate average luminance
-    avg_luminance = np.mean([get_luminance(p[0], p[1], p[2]) for p in pixels])
+    center_region = bg_arr[margin_y:height - margin_y, margin_x:width - margin_x]
+    avg_luminance = get_mean_luminance(center_region.reshape(-1, 3))
 
     # White text on dark, near-black on light
     if avg_luminance < 0.5:
@@ -129,7 +178,7 @@ def calculate_auto_title_color(background: Image.Image) -> str:
         return '#1a1a1a'  # Near-black on light
 
 
-def calculate_auto_wave_color(background: Image.Image) -> str:
+def calculate_auto_wave_color(background: Image.Image | np.ndarray) -> str:
     """
     Calculate optimal wave color based on background.
 
@@ -139,70 +188,55 @@ def calculate_auto_wave_color(background: Image.Image) -> str:
     3. Calculate center region luminance
     4. Pick color with best contrast, boost saturation
     """
-    width, height = background.size
+    bg_arr = _as_rgb_array(background)
+    height, width = bg_arr.shape[:2]
 
-    # Crop center 40% region
+    # Center 40% region, averaged down to 32x32 -- plenty for three clusters
     margin_x = int(width * 0.3)
     margin_y = int(height * 0.3)
-    center_region = background.crop((margin_x, margin_y, width - margin_x, height - margin_y))
+    center_region = bg_arr[margin_y:height - margin_y, margin_x:width - margin_x]
+    sample = _block_mean(center_region, 32, 32)
+    return _wave_color_for_sample(sample.tobytes())
+
 
-    # Resize for faster processing
-    sample = center_region.resize((100, 100), Image.Resampling.NEAREST)
-    pixels = np.array(sample).reshape(-1, 3)
+@lru_cache(maxsize=32)
+def _wave_color_for_sample(sample: bytes) -> str:
+    """Pick the wave color for a packed RGB sample (memoized on its bytes)."""
+    pixels = np.frombuffer(sample, dtype=np.uint8).reshape(-1, 3)
 
     # Calculate average luminance of center
-    avg_luminance = np.mean([get_luminance(p[0], p[1], p[2]) for p in pixels])
-
-    # Simple k-means clustering (3 clusters)
-    from random import sample as random_sample
-    n_clusters = 3
-
-    # Initialize centroids randomly
-    indices = random_sample(range(len(pixels)), min(n_clusters, len(pixels)))
-    centroids = pixels[indices].astype(float)
-
-    # Run k-means for 10 iterations
-    for _ in range(10):
-        # Assign pixels to nearest centroid
-        distances = np.sqrt(((pixels[:, np.newaxis] - centroids) ** 2).sum(axis=2))
-        labels = distances.argmin(axis=1)
-
-        # Update centroids
-        for i in range(n_clusters):
-            mask = labels == i
-            if mask.sum() > 0:
-                centroids[i] = pixels[mask].mean(axis=0)
-
-    # Find color with best contrast against center luminance
-    best_color = None
-    best_contrast = 0
-
-    for centroid in centroids:
-        r, g, b = int(centroid[0]), int(centroid[1]), int(centroid[2])
-        color_luminance = get_luminance(r, g, b)
-        contrast = abs(color_luminance - avg_luminance)
-
-        # Convert to HSV to check/boost saturation
-        h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
-
-        # Prefer more saturated colors
-        score = contrast + s * 0.3
-
-        if score > best_contrast:
-            best_contrast = score
-            # Boost saturation and adjust value for visibility
-            new_s = max(0.7, s)  # Minimum 70% saturation
-            new_v = 0.9 if avg_luminance < 0.5 else 0.7  # Bright on dark, darker on bright
-            best_color = (h, new_s, new_v)
+    avg_luminance = get_mean_luminance(pixels)
+
+    # K-means clustering (3 clusters), seeded from the sample so the same
+    # background always yields the same color. Degenerate samples (e.g. flat
+    # images) trigger empty-cluster warnings, which are harmless here.
+    seed = int.from_bytes(hashlib.blake2b(sample, digest_size=8).digest(), 'little')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        centroids, _ = kmeans2(pixels.astype(np.float32), 3, iter=10, minit='++',
+                               seed=np.random.default_rng(seed))
+
+    # Score all centroids at once: contrast against center luminance,
+    # plus a bonus for saturation (prefer more saturated colors)
+    rgb = centroids.astype(int)
+    contrast = np.abs(get_luminance(rgb[:, 0], rgb[:, 1], rgb[:, 2]) - avg_luminance)
+    hsv = rgb_to_hsv_np(rgb / 255)
+    score = contrast + hsv[:, 1] * 0.3
+    best = int(np.argmax(score))
 
     # If no good contrast found, use complementary approach
-    if best_contrast < 0.2:
+    if score[best] < 0.2:
         # Dark background -> bright cyan/green, Light background -> deep purple/blue
         if avg_luminance < 0.5:
             return '#00ff88'  # Bright green
         else:
             return '#6b21a8'  # Deep purple
 
+    # Boost saturation and adjust value for visibility
+    h, s = hsv[best, 0], hsv[best, 1]
+    new_s = max(0.7, s)  # Minimum 70% saturation
+    new_v = 0.9 if avg_luminance < 0.5 else 0.7  # Bright on dark, darker on bright
+
     # Convert back to RGB
-    r, g, b = colorsys.hsv_to_rgb(best_color[0], best_color[1], best_color[2])
+    r, g, b = hsv_to_rgb_np(np.array([[h, new_s, new_v]]))[0]
     return rgb_to_hex(int(r * 255), int(g * 255), int(b * 255))
@@ -1,15 +1,21 @@
 """CLI entry point for wavevid."""
-import click
-import random
+import argparse
+import csv
+import os
+import sys
 from pathlib import Path
-from .renderer import render_video, render_audio
+from . import __version__
 
 # Default directories (inside package)
-BACKGROUNDS_DIR = Path(__file__).parent / 'backgrounds'
-SOUNDS_DIR = Path(__file__).parent / 'sounds'
-FONTS_DIR = Path(__file__).parent / 'fonts'
+_PKG_DIR = Path(__file__).resolve().parent
+BACKGROUNDS_DIR = _PKG_DIR / 'backgrounds'
+SOUNDS_DIR = _PKG_DIR / 'sounds'
+FONTS_DIR = _PKG_DIR / 'fonts'
 DEFAULT_INTRO_FONT = FONTS_DIR / 'BeVietnamPro-Bold.ttf'
 
+# Intro backgrounds with these extensions are treated as video clips
+_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'})
+
 # Aspect ratio presets
 ASPECT_PRESETS = {
     '16:9': (1920, 1080),
@@ -21,82 +27,138 @@ ASPECT_PRESETS = {
 
 def discover_files(directory: Path, extensions: list[str]) -> list[Path]:
     """Dynamically discover files with given extensions in directory."""
+    # One scandir walk, filtering on entry names so only matches become Paths
+    exts = {f'.{ext.lower()}' for ext in extensions}
     files = []
-    for ext in extensions:
-        files.extend(directory.glob(f'*.{ext}'))
-        files.extend(directory.glob(f'**/*.{ext}'))
-    return list(set(files))
-
-
-@click.command()
-@click.argument('input_audio', type=click.Path(exists=True))
-@click.option('-o', '--output', 'output_video', default='output.mp4', help='Output video file')
-@click.option('--style', type=click.Choice(['waveform', 'radial', 'bars', 'spectrum', 'particles']), default='waveform', help='Visualization style')
-@click.option('--bg', 'bg_type', type=click.Choice(['color', 'gradient', 'image', 'random']), default='color', help='Background type (random picks from backgrounds/)')
-@click.option('--bg-value', default='#1a1a2e', help='Background value: hex color, "color1,color2" for gradient, or image path')
-@click.option('--wave-color', default='#00ff88', help='Wave/bar color (hex or "auto" for smart detection)')
-@click.option('--aspect', type=click.Choice(['16:9', '9:16', '1:1', '4:5']), help='Aspect ratio preset (overrides width/height)')
-@click.option('--width', default=1920, help='Video width')
-@click.option('--height', default=1080, help='Video height')
-@click.option('--fps', default=30, help='Frames per second')
-@click.option('--thumbnail', type=click.Path(), help='Save thumbnail image from first frame')
-@click.option('--avatar', 'avatar_path', type=click.Path(exists=True), help='Avatar image to place at center')
-@click.option('--avatar-size', type=int, help='Avatar size in pixels (default: 1/4 of min dimension)')
-@click.option('--subtitle/--no-subtitle', default=False, help='Enable subtitle transcription via Soniox')
-@click.option('--subtitle-font-size', type=int, help='Subtitle font size (default: height/20)')
-@click.option('--subtitle-color', default='auto', help='Subtitle text color (hex or "auto")')
-@click.option('--volume', default=100, type=int, help='Audio volume percentage (e.g., 120 for 120%)')
-@click.option('--replace', 'replacements', multiple=True, help='Text replacement in subtitles (format: old=new)')
-@click.option('--replace-file', type=click.Path(exists=True), help='File with replacements (one per line: old=new)')
-@click.option('--intro', 'intro_sound', type=click.Path(exists=True), help='Intro sound file')
-@click.option('--intro-duration', default=3.0, type=float, help='Intro solo duration in seconds before main audio starts (default: 3)')
-@click.option('--outro', 'outro_sound', type=click.Path(exists=True), help='Outro sound file')
-@click.option('--intro-title', help='Title text to display on intro clip')
-@click.option('--intro-subtitle', help='Subtitle text below intro title')
-@click.option('--intro-static/--intro-animated', default=False, help='Use static intro (no animation) for better social media thumbnails')
-@click.option('--intro-bg', type=click.Path(exists=True), help='Intro background (image or video file)')
-@click.option('--intro-font', type=click.Path(exists=True), help='Custom font for intro title (default: Be Vietnam Pro Bold)')
-@click.option('--intro-title-color', default='auto', help='Intro title color (hex or "auto")')
-@click.option('--intro-clip-duration', default=3.0, type=float, help='Intro clip duration in seconds (default: 3)')
-@click.option('--bg-music', type=click.Path(exists=True), help='Background music file (loops throughout video)')
-@click.option('--bg-music-volume', default=15, type=int, help='Background music volume percentage (default: 15)')
-@click.option('--end-screen/--no-end-screen', default=None, help='Enable/disable end screen (default: enabled when outro is set)')
-@click.option('--end-screen-duration', default=5.0, type=float, help='End screen duration in seconds (default: 5)')
-@click.option('--preset', type=click.Choice(['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']), default='ultrafast', help='Encoding speed preset (ultrafast=fast/low quality, veryslow=slow/high quality)')
-@click.option('--threads', type=int, default=0, help='Number of encoding threads (0=auto, based on CPU cores)')
-@click.option('--wave-sync', default=0.0, type=float, help='Waveform sync offset in seconds (positive=delay wave, negative=advance wave)')
-@click.option('--audio-only', is_flag=True, default=False, help='Generate audio mix only (no video rendering)')
-def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect, width, height, fps, thumbnail, avatar_path, avatar_size, subtitle, subtitle_font_size, subtitle_color, volume, replacements, replace_file, intro_sound, intro_duration, outro_sound, intro_title, intro_subtitle, intro_static, intro_bg, intro_font, intro_title_color, intro_clip_duration, bg_music, bg_music_volume, end_screen, end_screen_duration, preset, threads, wave_sync, audio_only):
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in exts:
+                    files.append(Path(entry.path))
+    return files
+
+
+def _existing_path(value: str) -> str:
+    """argparse type for file arguments that must already exist."""
+    if not os.path.exists(value):
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return value
+
+
+def _add_flag_pair(parser: argparse.ArgumentParser, on: str, off: str, dest: str, default, help: str):
+    """Add a --flag/--no-flag style switch pair writing to one destination."""
+    parser.add_argument(on, dest=dest, action='store_true', help=help)
+    parser.add_argument(off, dest=dest, action='store_false', help=f'Opposite of {on}')
+    parser.set_defaults(**{dest: default})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the wavevid command."""
+    parser = argparse.ArgumentParser(prog='wavevid', description='Generate waveform video from audio file.')
+    parser.add_argument('--version', action='version', version=f'wavevid, version {__version__}')
+    parser.add_argument('input_audio', type=_existing_path)
+    parser.add_argument('-o', '--output', dest='output_video', default='output.mp4', help='Output video file')
+    parser.add_argument('--style', choices=['waveform', 'radial', 'bars', 'spectrum', 'particles'], default='waveform', help='Visualization style')
+    parser.add_argument('--bg', dest='bg_type', choices=['color', 'gradient', 'image', 'random'], default='color', help='Background type (random picks from backgrounds/)')
+    parser.add_argument('--bg-value', default='#1a1a2e', help='Background value: hex color, "color1,color2" for gradient, or image path')
+    parser.add_argument('--wave-color', default='#00ff88', help='Wave/bar color (hex, or "auto" to analyze an image background)')
+    parser.add_argument('--aspect', choices=['16:9', '9:16', '1:1', '4:5'], help='Aspect ratio preset (overrides width/height)')
+    parser.add_argument('--width', default=1920, type=int, help='Video width')
+    parser.add_argument('--height', default=1080, type=int, help='Video height')
+    parser.add_argument('--fps', default=30, type=int, help='Frames per second')
+    parser.add_argument('--thumbnail', help='Save thumbnail image from first frame')
+    parser.add_argument('--avatar', dest='avatar_path', type=_existing_path, help='Avatar image to place at center')
+    parser.add_argument('--avatar-size', type=int, help='Avatar size in pixels (default: 1/4 of min dimension)')
+    _add_flag_pair(parser, '--subtitle', '--no-subtitle', 'subtitle', False, 'Enable subtitle transcription via Soniox')
+    parser.add_argument('--subtitle-font-size', type=int, help='Subtitle font size (default: height/20)')
+    parser.add_argument('--subtitle-color', default='auto', help='Subtitle text color (hex, or "auto" to analyze an image background; only when --subtitle is set)')
+    parser.add_argument('--volume', default=100, type=int, help='Audio volume percentage (e.g., 120 for 120%%)')
+    parser.add_argument('--replace', dest='replacements', action='append', default=[], help='Text replacement in subtitles (format: old=new)')
+    parser.add_argument('--replace-file', type=_existing_path, help='File with replacements (one per line: old=new)')
+    parser.add_argument('--intro', dest='intro_sound', type=_existing_path, help='Intro sound file')
+    parser.add_argument('--intro-duration', default=3.0, type=float, help='Intro solo duration in seconds before main audio starts (default: 3)')
+    parser.add_argument('--outro', dest='outro_sound', type=_existing_path, help='Outro sound file')
+    parser.add_argument('--intro-title', help='Title text to display on intro clip')
+    parser.add_argument('--intro-subtitle', help='Subtitle text below intro title')
+    _add_flag_pair(parser, '--intro-static', '--intro-animated', 'intro_static', False, 'Use static intro (no animation) for better social media thumbnails')
+    parser.add_argument('--intro-bg', type=_existing_path, help='Intro background (image or video file)')
+    parser.add_argument('--intro-font', type=_existing_path, help='Custom font for intro title (default: Be Vietnam Pro Bold)')
+    parser.add_argument('--intro-title-color', default='auto', help='Intro title color (hex or "auto")')
+    parser.add_argument('--intro-clip-duration', default=3.0, type=float, help='Intro clip duration in seconds (default: 3)')
+    parser.add_argument('--bg-music', type=_existing_path, help='Background music file (loops throughout video)')
+    parser.add_argument('--bg-music-volume', default=15, type=int, help='Background music volume percentage (default: 15)')
+    _add_flag_pair(parser, '--end-screen', '--no-end-screen', 'end_screen', None, 'Enable/disable end screen (default: enabled when outro is set)')
+    parser.add_argument('--end-screen-duration', default=5.0, type=float, help='End screen duration in seconds (default: 5)')
+    parser.add_argument('--preset', choices=['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow'], default='ultrafast', help='Encoding speed preset (ultrafast=fast/low quality, veryslow=slow/high quality)')
+    parser.add_argument('--hw-encoder', choices=['none', 'auto', 'nvenc', 'qsv', 'videotoolbox'], default='none', help='Hardware H.264 encoder (auto=first available; falls back to libx264)')
+    parser.add_argument('--threads', type=int, default=0, help='Number of encoder and filter threads (0=auto, one per CPU core)')
+    parser.add_argument('--workers', type=int, default=0, help='Number of frame rendering processes (0=auto, one per CPU core; 1=single process)')
+    parser.add_argument('--wave-sync', default=0.0, type=float, help='Waveform sync offset in seconds (positive=delay wave, negative=advance wave)')
+    parser.add_argument('--audio-only', action='store_true', help='Generate audio mix only (no video rendering)')
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    """Console entry point: parse arguments and run."""
+    if argv is None:
+        argv = sys.argv[1:]
+    # Answer a bare --version without building the parser
+    if argv == ['--version']:
+        print(f'wavevid, version {__version__}')
+        return
+    args = build_parser().parse_args(argv)
+    run(**vars(args))
+
+
+def run(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect, width, height, fps, thumbnail, avatar_path, avatar_size, subtitle, subtitle_font_size, subtitle_color, volume, replacements, replace_file, intro_sound, intro_duration, outro_sound, intro_title, intro_subtitle, intro_static, intro_bg, intro_font, intro_title_color, intro_clip_duration, bg_music, bg_music_volume, end_screen, end_screen_duration, preset, hw_encoder, threads, workers, wave_sync, audio_only):
     """Generate waveform video from audio file."""
     # Apply aspect ratio preset if specified
     if aspect:
         width, height = ASPECT_PRESETS[aspect]
-        click.echo(f"Aspect ratio {aspect}: {width}x{height}")
+        print(f"Aspect ratio {aspect}: {width}x{height}")
     # Handle random background selection (dynamic discovery)
     if bg_type == 'random':
         bg_files = discover_files(BACKGROUNDS_DIR, ['jpg', 'jpeg', 'png', 'webp'])
         if bg_files:
+            import random
             bg_value = str(random.choice(bg_files))
             bg_type = 'image'
-            click.echo(f"Random background: {Path(bg_value).name}")
+            print(f"Random background: {Path(bg_value).name}")
         else:
-            click.echo("No backgrounds found, using default color")
+            print("No backgrounds found, using default color")
             bg_type = 'color'
             bg_value = '#1a1a2e'
 
-    # Handle auto colors
-    temp_bg = None
-    if (wave_color == 'auto' or subtitle_color == 'auto') and bg_type == 'image':
-        from .backgrounds import get_background, calculate_auto_wave_color, calculate_auto_subtitle_color
-        temp_bg = get_background(width, height, bg_type, bg_value)
+    # Handle auto colors. Explicit hex colors skip analysis entirely, and the
+    # subtitle color is only analyzed when subtitles are actually rendered.
+    auto_subtitle_color = subtitle and subtitle_color == 'auto'
+    auto_title_color = intro_title and intro_title_color == 'auto'
+    if wave_color == 'auto' or auto_subtitle_color or auto_title_color:
+        import numpy as np
+        from .backgrounds import (
+            get_background, calculate_auto_wave_color, calculate_auto_subtitle_color, calculate_auto_title_color,
+        )
 
+    # Backgrounds decoded for auto-color analysis, each loaded at most once.
+    # Kept as arrays; the auto-color helpers slice them without copying.
+    bg_cache = {}
+
+    def load_bg_array(kind: str, value: str):
+        if (kind, value) not in bg_cache:
+            bg_cache[kind, value] = np.asarray(get_background(width, height, kind, value))
+        return bg_cache[kind, value]
+
+    if (wave_color == 'auto' or auto_subtitle_color) and bg_type == 'image':
         if wave_color == 'auto':
-            wave_color = calculate_auto_wave_color(temp_bg)
-            click.echo(f"Auto wave color: {wave_color}")
+            wave_color = calculate_auto_wave_color(load_bg_array(bg_type, bg_value))
+            print(f"Auto wave color: {wave_color}")
 
-        if subtitle_color == 'auto':
-            subtitle_color = calculate_auto_subtitle_color(temp_bg)
-            click.echo(f"Auto subtitle color: {subtitle_color}")
+        if auto_subtitle_color:
+            subtitle_color = calculate_auto_subtitle_color(load_bg_array(bg_type, bg_value))
+            print(f"Auto subtitle color: {subtitle_color}")
 
     # Fallback for auto colors when not using image background
     if wave_color == 'auto':
@@ -107,71 +169,72 @@ def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect
     # Handle intro clip settings
     intro_font_path = intro_font if intro_font else str(DEFAULT_INTRO_FONT)
     if intro_title:
-        click.echo(f"Intro clip: {intro_clip_duration}s with title")
+        print(f"Intro clip: {intro_clip_duration}s with title")
         if intro_bg:
-            click.echo(f"Intro background: {Path(intro_bg).name}")
+            print(f"Intro background: {Path(intro_bg).name}")
 
         # Auto detect intro title color based on intro background
-        if intro_title_color == 'auto':
-            from .backgrounds import get_background, calculate_auto_title_color
-            if intro_bg and intro_bg.lower().endswith(('.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v')):
+        if auto_title_color:
+            if intro_bg and Path(intro_bg).suffix.lower() in _VIDEO_EXTS:
                 # Video background - default to white (most videos are dark)
                 intro_title_color = '#ffffff'
             elif intro_bg:
                 # Static image intro background - calculate auto color
-                intro_bg_img = get_background(width, height, 'image', intro_bg)
-                intro_title_color = calculate_auto_title_color(intro_bg_img)
+                intro_title_color = calculate_auto_title_color(load_bg_array('image', intro_bg))
             elif bg_type == 'image':
                 # Use main background for auto color
-                if temp_bg is None:
-                    temp_bg = get_background(width, height, bg_type, bg_value)
-                intro_title_color = calculate_auto_title_color(temp_bg)
+                intro_title_color = calculate_auto_title_color(load_bg_array(bg_type, bg_value))
             else:
                 # Default to white for dark backgrounds
                 intro_title_color = '#ffffff'
-            click.echo(f"Auto intro title color: {intro_title_color}")
+            print(f"Auto intro title color: {intro_title_color}")
 
     # Log background music if provided
     if bg_music:
-        click.echo(f"Background music: {Path(bg_music).name} at {bg_music_volume}%")
+        print(f"Background music: {Path(bg_music).name} at {bg_music_volume}%")
 
-    click.echo(f"Input: {input_audio}")
-    click.echo(f"Output: {output_video}")
-    click.echo(f"Style: {style}, Resolution: {width}x{height}, FPS: {fps}")
+    print(f"Input: {input_audio}")
+    print(f"Output: {output_video}")
+    print(f"Style: {style}, Resolution: {width}x{height}, FPS: {fps}")
     if volume != 100:
-        click.echo(f"Volume: {volume}%")
+        print(f"Volume: {volume}%")
 
     def progress(msg):
-        click.echo(msg)
+        print(msg, flush=True)
 
     # Transcribe if subtitles enabled
     subtitles = None
     if subtitle:
         from .transcribe import transcribe_audio, tokens_to_subtitles
-        click.echo("Transcribing audio...")
+        print("Transcribing audio...")
         tokens = transcribe_audio(input_audio, progress_callback=progress)
         # Parse replacements from file and command line
         replace_dict = {}
         if replace_file:
-            with open(replace_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        old, new = line.split('=', 1)
-                        replace_dict[old] = new
+            # csv splits the lines in C; extra fields mean '=' inside the value
+            with open(replace_file, 'r', encoding='utf-8', newline='') as f:
+                rows = csv.reader(f, delimiter='=', quoting=csv.QUOTE_NONE)
+                replace_dict = {
+                    row[0].lstrip(): '='.join(row[1:]).rstrip()
+                    for row in rows
+                    if len(row) > 1 and not row[0].lstrip().startswith('#')
+                }
         # Command line replacements override file
-        for r in replacements:
-            if '=' in r:
-                old, new = r.split('=', 1)
-                replace_dict[old] = new
+        replace_dict.update(
+            (old, new) for old, sep, new in (r.partition('=') for r in replacements) if sep
+        )
         subtitles = tokens_to_subtitles(tokens, replacements=replace_dict)
-        click.echo(f"Generated {len(subtitles)} subtitle segments")
+        print(f"Generated {len(subtitles)} subtitle segments")
 
     # Log performance settings if non-default
     if preset != 'ultrafast':
-        click.echo(f"Encoding preset: {preset}")
+        print(f"Encoding preset: {preset}")
+    if hw_encoder != 'none':
+        print(f"Hardware encoder: {hw_encoder}")
     if threads > 0:
-        click.echo(f"Threads: {threads}")
+        print(f"Threads: {threads}")
+    if workers > 0:
+        print(f"Render workers: {workers}")
 
     import time
     start_time = time.time()
@@ -181,8 +244,10 @@ def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect
         output_file = output_video
         if not output_file.lower().endswith(('.mp3', '.m4a', '.aac', '.wav')):
             output_file = output_file.rsplit('.', 1)[0] + '.m4a'
-        click.echo(f"Audio-only mode: {output_file}")
+        print(f"Audio-only mode: {output_file}")
 
+        # Deferred so --help/--version don't pay for the render stack
+        from .renderer import render_audio
         success, audio_duration = render_audio(
             input_audio=input_audio,
             output_audio=output_file,
@@ -200,18 +265,19 @@ def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect
         elapsed = time.time() - start_time
 
         if success:
-            click.echo(f"Audio saved to {output_file}")
+            print(f"Audio saved to {output_file}")
             elapsed_min = int(elapsed // 60)
             elapsed_sec = elapsed % 60
             audio_min = int(audio_duration // 60)
             audio_sec = audio_duration % 60
             ratio = elapsed / audio_duration if audio_duration > 0 else 0
-            click.echo(f"Time: {elapsed_min}m {elapsed_sec:.1f}s / Audio: {audio_min}m {audio_sec:.1f}s (ratio: {ratio:.2f}x)")
+            print(f"Time: {elapsed_min}m {elapsed_sec:.1f}s / Audio: {audio_min}m {audio_sec:.1f}s (ratio: {ratio:.2f}x)")
         else:
-            click.echo("Error generating audio", err=True)
+            print("Error generating audio", file=sys.stderr)
             raise SystemExit(1)
     else:
         # Video mode
+        from .renderer import render_video
         success, video_duration = render_video(
             input_audio=input_audio,
             output_video=output_video,
@@ -245,7 +311,9 @@ def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect
             end_screen=end_screen if end_screen is not None else (outro_sound is not None),
             end_screen_duration=end_screen_duration,
             preset=preset,
+            hw_encoder=hw_encoder,
             threads=threads,
+            workers=workers,
             wave_sync=wave_sync,
             progress_callback=progress
         )
@@ -253,15 +321,15 @@ def main(input_audio, output_video, style, bg_type, bg_value, wave_color, aspect
         elapsed = time.time() - start_time
 
         if success:
-            click.echo(f"Video saved to {output_video}")
+            print(f"Video saved to {output_video}")
             elapsed_min = int(elapsed // 60)
             elapsed_sec = elapsed % 60
             video_min = int(video_duration // 60)
             video_sec = video_duration % 60
             ratio = elapsed / video_duration if video_duration > 0 else 0
-            click.echo(f"Time: {elapsed_min}m {elapsed_sec:.1f}s / Video: {video_min}m {video_sec:.1f}s (ratio: {ratio:.2f}x)")
+            print(f"Time: {elapsed_min}m {elapsed_sec:.1f}s / Video: {video_min}m {video_sec:.1f}s (ratio: {ratio:.2f}x)")
         else:
-            click.echo("Error generating video", err=True)
+            print("Error generating video", file=sys.stderr)
             raise SystemExit(1)
 
 
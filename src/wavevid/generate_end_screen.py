@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 """Generate end screen template videos for different aspect ratios."""
-import qrcode
-from PIL import Image, ImageDraw, ImageFont
+from __future__ import annotations
+
+import hashlib
 import subprocess
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# PIL, NumPy and qrcode are imported where they are used, so importing this
+# module for its presets and defaults stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
 
-TEMPLATES_DIR = Path(__file__).parent / "templates"
-FONTS_DIR = Path(__file__).parent / "fonts"
-BACKGROUNDS_DIR = Path(__file__).parent / "backgrounds"
+_PKG_DIR = Path(__file__).resolve().parent
+TEMPLATES_DIR = _PKG_DIR / "templates"
+FONTS_DIR = _PKG_DIR / "fonts"
+BACKGROUNDS_DIR = _PKG_DIR / "backgrounds"
+FONT_PATH = FONTS_DIR / "BeVietnamPro-Bold.ttf"
 
 # Default settings
 DEFAULT_CONFIG = {
@@ -29,96 +39,184 @@ ASPECT_PRESETS = {
 }
 
 
-def create_overlay(width: int, height: int, config: dict) -> Image.Image:
-    """Create transparent overlay with credits."""
-    font_path = str(FONTS_DIR / "BeVietnamPro-Bold.ttf")
+@lru_cache(maxsize=8)
+def _load_avatar(path: str) -> Image.Image:
+    """Decode the avatar once and crop 10% off each edge."""
+    from PIL import Image
+
+    avatar = Image.open(path).convert('RGBA')
+    w, h = avatar.size
+    crop_margin = int(min(w, h) * 0.10)
+    return avatar.crop((crop_margin, crop_margin, w - crop_margin, h - crop_margin))
+
+
+@lru_cache(maxsize=8)
+def _circular_avatar(path: str, logo_size: int) -> Image.Image:
+    """Avatar resized to logo_size and clipped to a circle."""
+    from PIL import Image
+    # Same rim as the avatar in rendered videos; absolute so the module also runs as a script
+    from wavevid.renderer import _circle_mask
+
+    avatar = _load_avatar(path).resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+    avatar_circle = Image.new('RGBA', (logo_size, logo_size), (0, 0, 0, 0))
+    avatar_circle.paste(avatar, (0, 0))
+    avatar_circle.putalpha(_circle_mask(logo_size))
+    return avatar_circle
+
+
+@lru_cache(maxsize=8)
+def _render_content_block(base_size: int, cta: str, email: str, url: str, avatar_path: str) -> Image.Image:
+    """Render the avatar/CTA/QR/email column onto a transparent tile.
+
+    The tile's horizontal center is the column's center line and its top
+    is the avatar's top edge. Every preset shares the same base size, so
+    one tile serves all aspect ratios.
+    """
+    import numpy as np
+    import qrcode
+    from PIL import Image, ImageDraw, ImageFont
+
+    font_path = str(FONT_PATH)
 
     # Scale font sizes based on smaller dimension
-    base_size = min(width, height)
     font_cta = ImageFont.truetype(font_path, int(base_size * 0.045))
     font_email = ImageFont.truetype(font_path, int(base_size * 0.033))
 
     # Generate QR code
     qr = qrcode.QRCode(version=1, box_size=8, border=2)
-    qr.add_data(config["url"])
+    qr.add_data(url)
     qr.make(fit=True)
     qr_img = qr.make_image(fill_color="white", back_color=(0, 0, 0, 0)).convert('RGBA')
     qr_size = int(base_size * 0.185)
     qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.LANCZOS)
 
-    # Make QR background transparent
-    qr_data = list(qr_img.getdata())
-    new_qr_data = [(0, 0, 0, 0) if (p[0] == 0 and p[1] == 0 and p[2] == 0) else p for p in qr_data]
-    qr_img.putdata(new_qr_data)
+    # Make QR background transparent (pure black pixels -> fully clear)
+    qr_arr = np.array(qr_img)
+    black = (qr_arr[..., :3] == 0).all(axis=-1)
+    qr_arr[black] = 0
+    qr_img = Image.fromarray(qr_arr, 'RGBA')
 
-    # Load and prepare avatar
-    avatar = Image.open(config["avatar_path"]).convert('RGBA')
-    w, h = avatar.size
-    crop_margin = int(min(w, h) * 0.10)
-    avatar = avatar.crop((crop_margin, crop_margin, w - crop_margin, h - crop_margin))
+    # Avatar (decode, crop and mask are cached across aspects)
     logo_size = int(base_size * 0.167)
-    avatar = avatar.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+    avatar_circle = _circular_avatar(avatar_path, logo_size)
 
-    # Create circular mask
-    scale = 4
-    mask_large = Image.new('L', (logo_size * scale, logo_size * scale), 0)
-    ImageDraw.Draw(mask_large).ellipse([0, 0, logo_size * scale - 1, logo_size * scale - 1], fill=255)
-    mask = mask_large.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-    avatar_circle = Image.new('RGBA', (logo_size, logo_size), (0, 0, 0, 0))
-    avatar_circle.paste(avatar, (0, 0))
-    avatar_circle.putalpha(mask)
-
-    # Create overlay
-    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    # Text extents decide the tile size; twice the widest element leaves
+    # room for glyph bearings on either side of the center line
+    cta_bbox = font_cta.getbbox(cta)
+    email_bbox = font_email.getbbox(email)
+    cta_y = logo_size + 50
+    qr_y = cta_y + 80
+    email_y = qr_y + qr_size + 30
+    block_w = 2 * max(logo_size, qr_size, cta_bbox[2], email_bbox[2])
+    block_h = email_y + max(email_bbox[3], 40)
 
-    # Layout
-    center_x = width // 2
-    total_height = logo_size + 50 + 60 + qr_size + 30 + 40  # Approximate total content height
-    start_y = (height - total_height) // 2
+    block = Image.new('RGBA', (block_w, block_h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(block)
+    center_x = block_w // 2
 
     # Avatar
-    avatar_x = center_x - logo_size // 2
-    avatar_y = start_y
-    overlay.paste(avatar_circle, (avatar_x, avatar_y), avatar_circle)
+    block.paste(avatar_circle, (center_x - logo_size // 2, 0), avatar_circle)
 
     # CTA
-    cta_bbox = draw.textbbox((0, 0), config["cta"], font=font_cta)
     cta_w = cta_bbox[2] - cta_bbox[0]
-    cta_x = center_x - cta_w // 2
-    cta_y = avatar_y + logo_size + 50
-    draw.text((cta_x, cta_y), config["cta"], fill=(255, 255, 255, 255), font=font_cta)
+    draw.text((center_x - cta_w // 2, cta_y), cta, fill=(255, 255, 255, 255), font=font_cta)
 
     # QR
-    qr_x = center_x - qr_size // 2
-    qr_y = cta_y + 80
-    overlay.paste(qr_img, (qr_x, qr_y), qr_img)
+    block.paste(qr_img, (center_x - qr_size // 2, qr_y), qr_img)
 
     # Email
-    email_bbox = draw.textbbox((0, 0), config["email"], font=font_email)
     email_w = email_bbox[2] - email_bbox[0]
-    email_x = center_x - email_w // 2
-    email_y = qr_y + qr_size + 30
-    draw.text((email_x, email_y), config["email"], fill=(150, 150, 150, 255), font=font_email)
+    draw.text((center_x - email_w // 2, email_y), email, fill=(150, 150, 150, 255), font=font_email)
+
+    return block
+
+
+def create_overlay(width: int, height: int, config: dict) -> Image.Image:
+    """Create transparent overlay with credits."""
+    from PIL import Image
 
+    base_size = min(width, height)
+    block = _render_content_block(base_size, config["cta"], config["email"], config["url"], config["avatar_path"])
+
+    # Layout
+    logo_size = int(base_size * 0.167)
+    qr_size = int(base_size * 0.185)
+    total_height = logo_size + 50 + 60 + qr_size + 30 + 40  # Approximate total content height
+    start_y = (height - total_height) // 2
+
+    # The tile was drawn onto transparency, so a plain paste reproduces it exactly
+    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    overlay.paste(block, (width // 2 - block.width // 2, start_y))
     return overlay
 
 
-def generate_template(aspect: str, config: dict = None):
-    """Generate end screen template for given aspect ratio."""
-    config = {**DEFAULT_CONFIG, **(config or {})}
+def _output_path(aspect: str) -> Path:
     width, height = ASPECT_PRESETS[aspect]
+    return TEMPLATES_DIR / f"end_screen_{width}x{height}.mp4"
 
-    TEMPLATES_DIR.mkdir(exist_ok=True)
 
-    # Create overlay
+def _prepare_overlay(aspect: str, config: dict) -> tuple[int, int, str, Path]:
+    """Render the overlay PNG for an aspect; return (width, height, overlay_path, output_path)."""
+    width, height = ASPECT_PRESETS[aspect]
     overlay = create_overlay(width, height, config)
     overlay_path = f"/tmp/end_screen_overlay_{aspect.replace(':', 'x')}.png"
     overlay.save(overlay_path)
+    return width, height, overlay_path, _output_path(aspect)
+
+
+def _config_stamp(config: dict) -> str:
+    """Short hash of everything besides input files that affects a template."""
+    payload = repr((sorted(config.items()), _output_args(config)))
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _is_up_to_date(output_path: Path, config: dict) -> bool:
+    """True if output_path was built from this config and is newer than all inputs."""
+    inputs = [BACKGROUNDS_DIR / config["video_bg"], config["avatar_path"], FONT_PATH]
+    try:
+        if output_path.with_suffix('.stamp').read_text() != _config_stamp(config):
+            return False
+        return output_path.stat().st_mtime > max(os.path.getmtime(p) for p in inputs)
+    except OSError:
+        return False
+
+
+def _write_stamp(output_path: Path, config: dict):
+    output_path.with_suffix('.stamp').write_text(_config_stamp(config))
+
+
+def _overlay_filter(src: str, overlay_input: int, width: int, height: int, out: str) -> str:
+    """Filter chain that fills width x height with the background and overlays the credits."""
+    return (
+        f'[{src}]scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},setsar=1[bg_{out}];'
+        f'[bg_{out}][{overlay_input}:v]overlay=0:0:format=auto[{out}]'
+    )
+
 
-    # Output path
-    output_name = f"end_screen_{width}x{height}.mp4"
-    output_path = TEMPLATES_DIR / output_name
+def _output_args(config: dict) -> list[str]:
+    """Per-output encoding options shared by every template."""
+    return [
+        '-t', str(config["duration"]),
+        '-r', str(config["fps"]),
+        '-c:v', 'libx264',
+        '-preset', 'veryfast',
+        '-crf', '20',
+        # Short clip: a single GOP, no periodic keyframes
+        '-g', str(int(config["fps"] * config["duration"])),
+        '-pix_fmt', 'yuv420p',
+    ]
+
+
+def generate_template(aspect: str, config: dict = None):
+    """Generate end screen template for given aspect ratio."""
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    TEMPLATES_DIR.mkdir(exist_ok=True)
+
+    if _is_up_to_date(_output_path(aspect), config):
+        print(f"Skipping {aspect} template (up to date)")
+        return str(_output_path(aspect))
+
+    width, height, overlay_path, output_path = _prepare_overlay(aspect, config)
     video_bg = BACKGROUNDS_DIR / config["video_bg"]
 
     # Generate video with FFmpeg
@@ -127,16 +225,9 @@ def generate_template(aspect: str, config: dict = None):
         '-stream_loop', '-1',
         '-i', str(video_bg),
         '-i', overlay_path,
-        '-filter_complex',
-        f'[0:v]scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},setsar=1[bg];'
-        f'[bg][1:v]overlay=0:0:format=auto[out]',
+        '-filter_complex', _overlay_filter('0:v', 1, width, height, 'out'),
         '-map', '[out]',
-        '-t', str(config["duration"]),
-        '-r', str(config["fps"]),
-        '-c:v', 'libx264',
-        '-preset', 'medium',
-        '-crf', '18',
-        '-pix_fmt', 'yuv420p',
+        *_output_args(config),
         str(output_path)
     ]
 
@@ -144,6 +235,7 @@ def generate_template(aspect: str, config: dict = None):
     result = subprocess.run(cmd, capture_output=True, text=True)
 
     if result.returncode == 0:
+        _write_stamp(output_path, config)
         print(f"  Saved: {output_path}")
         return str(output_path)
     else:
@@ -152,9 +244,49 @@ def generate_template(aspect: str, config: dict = None):
 
 
 def generate_all_templates(config: dict = None):
-    """Generate templates for all aspect ratios."""
+    """Generate templates for all aspect ratios.
+
+    Uses a single FFmpeg run: the background is decoded once and split
+    into one scale/crop/overlay branch per aspect, each with its own output.
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    TEMPLATES_DIR.mkdir(exist_ok=True)
+
+    aspects = []
     for aspect in ASPECT_PRESETS:
-        generate_template(aspect, config)
+        if _is_up_to_date(_output_path(aspect), config):
+            print(f"Skipping {aspect} template (up to date)")
+        else:
+            aspects.append(aspect)
+    if not aspects:
+        return [str(_output_path(aspect)) for aspect in ASPECT_PRESETS]
+
+    video_bg = BACKGROUNDS_DIR / config["video_bg"]
+
+    cmd = ['ffmpeg', '-y', '-stream_loop', '-1', '-i', str(video_bg)]
+    filters = [f'[0:v]split={len(aspects)}' + ''.join(f'[src{i}]' for i in range(len(aspects)))]
+    outputs = []
+    for i, aspect in enumerate(aspects):
+        width, height, overlay_path, output_path = _prepare_overlay(aspect, config)
+        print(f"Generating {aspect} template ({width}x{height})...")
+        cmd += ['-i', overlay_path]
+        filters.append(_overlay_filter(f'src{i}', i + 1, width, height, f'out{i}'))
+        outputs.append(output_path)
+
+    cmd += ['-filter_complex', ';'.join(filters)]
+    for i, output_path in enumerate(outputs):
+        cmd += ['-map', f'[out{i}]', *_output_args(config), str(output_path)]
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode == 0:
+        for output_path in outputs:
+            _write_stamp(output_path, config)
+            print(f"  Saved: {output_path}")
+        return [str(_output_path(aspect)) for aspect in ASPECT_PRESETS]
+    else:
+        print(f"  Error: {result.stderr}")
+        return None
 
 
 if __name__ == "__main__":
@@ -1,18 +1,114 @@
 """Frame generation and video output via FFmpeg."""
 import os
 import subprocess
+import threading
+import time
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 import numpy as np
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from collections import deque
+from queue import Queue
+from PIL import Image, ImageDraw, ImageFont, __version__ as _PIL_VERSION
 from multiprocessing import Pool, cpu_count
-from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from contextlib import contextmanager
+from functools import lru_cache, partial, wraps
+from itertools import accumulate
 from .audio import load_audio, get_amplitude_envelope, get_frequency_bands, get_waveform_chunks
 from .backgrounds import get_background
 from .visualizers import get_visualizer
 
+_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'})
 
+# Pillow-SIMD installs as "Pillow" with a ".postN" version; its SIMD paste and
+# alpha_composite loops speed up every per-frame composite without code changes
+PILLOW_SIMD = '.post' in _PIL_VERSION
+
+# Kernel buffer size requested for the raw-frame pipes (Linux only)
+_PIPE_SIZE = 8 << 20
+
+
+def _enlarge_pipe(pipe, size: int = _PIPE_SIZE):
+    """Grow a pipe's kernel buffer so a whole frame moves in few write()/read() calls.
+
+    Unprivileged processes are capped at /proc/sys/fs/pipe-max-size (1 MiB by
+    default), so fall back to that; platforms without F_SETPIPE_SZ keep the default.
+    """
+    if fcntl is None or not hasattr(fcntl, 'F_SETPIPE_SZ'):
+        return
+    for request in (size, 1 << 20):
+        try:
+            fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, request)
+            return
+        except OSError:
+            continue
+
+
+# Hardware H.264 encoders, in the order hw_encoder='auto' tries them: the
+# options standing in for libx264's preset/tune/crf, and the pixel format
+# each one takes
+_HW_ENCODERS = {
+    'nvenc': (['-c:v:0', 'h264_nvenc', '-preset', 'p1', '-tune', 'll', '-rc', 'vbr', '-cq', '23'], 'yuv420p'),
+    'qsv': (['-c:v:0', 'h264_qsv', '-preset', 'veryfast', '-global_quality', '23'], 'nv12'),
+    'videotoolbox': (['-c:v:0', 'h264_videotoolbox', '-q:v:0', '65'], 'yuv420p'),
+}
+
+
+@lru_cache(maxsize=None)
+def _hw_encoder_works(name: str) -> bool:
+    """True if FFmpeg can open the named hardware encoder on this machine.
+
+    Being listed by `ffmpeg -encoders` only means it was compiled in, so a
+    short test encode checks that a usable device is actually present.
+    """
+    args, pix_fmt = _HW_ENCODERS[name]
+    cmd = [
+        'ffmpeg', '-hide_banner', '-v', 'error',
+        '-f', 'lavfi', '-i', 'color=s=256x256:d=0.1',
+        *args, '-pix_fmt', pix_fmt, '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def _video_decodes(path) -> bool:
+    """True if FFmpeg can open path and decode its first video frame."""
+    cmd = ['ffmpeg', '-v', 'error', '-i', str(path), '-map', '0:v:0', '-frames:v', '1', '-f', 'null', '-']
+    try:
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def _resolve_hw_encoder(hw_encoder: str, progress_callback=None) -> str | None:
+    """Map a hw_encoder setting ('auto', 'none' or an _HW_ENCODERS key) to a usable encoder or None."""
+    if not hw_encoder or hw_encoder == 'none':
+        return None
+    if hw_encoder == 'auto':
+        return next((name for name in _HW_ENCODERS if _hw_encoder_works(name)), None)
+    if hw_encoder not in _HW_ENCODERS:
+        raise ValueError(f"Unknown hardware encoder: {hw_encoder}")
+    if _hw_encoder_works(hw_encoder):
+        return hw_encoder
+    if progress_callback:
+        progress_callback(f"Warning: {hw_encoder} encoder unavailable, using libx264")
+    return None
+
+
+@lru_cache(maxsize=128)
 def get_font(size: int) -> ImageFont.FreeTypeFont:
-    """Get a font, falling back to default if needed."""
+    """Get a font, falling back to default if needed.
+
+    Fonts are cached per size, so callers share one FreeType face per size.
+    """
     # Try common system fonts
     font_paths = [
         "/System/Library/Fonts/Helvetica.ttc",
@@ -28,46 +124,122 @@ def get_font(size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
+# Text measurements and wrapped layouts repeat across frames (same subtitle
+# for a whole segment, same intro title every frame), so both are memoized.
+# Fonts are keyed by file and size because callers create fresh font objects.
+_TEXT_CACHE_LIMIT = 4096
+_BBOX_CACHE: dict = {}
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+def _font_key(font: ImageFont.FreeTypeFont) -> tuple:
+    path = getattr(font, 'path', None)
+    return (path, font.size) if isinstance(path, str) else ('id', id(font))
+
+
+def _text_bbox(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+    """Cached equivalent of draw.textbbox((0, 0), text, font=font)."""
+    key = (text, _font_key(font))
+    bbox = _BBOX_CACHE.get(key)
+    if bbox is None:
+        if len(_BBOX_CACHE) >= _TEXT_CACHE_LIMIT:
+            _BBOX_CACHE.clear()
+        bbox = _BBOX_CACHE[key] = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    return bbox
+
+
+def _memoize_wrap(func):
+    """Memoize a wrap function on (text, font, max_width)."""
+    cache = {}
+
+    @wraps(func)
+    def wrapper(text, font, max_width, draw=None):
+        key = (text, _font_key(font), max_width)
+        lines = cache.get(key)
+        if lines is None:
+            if len(cache) >= _TEXT_CACHE_LIMIT:
+                cache.clear()
+            lines = cache[key] = tuple(func(text, font, max_width, draw))
+        return list(lines)
+
+    return wrapper
+
+
+@_memoize_wrap
 def wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, draw: ImageDraw.Draw) -> list[str]:
     """Wrap text to fit within max_width."""
     words = text.split()
+    if not words:
+        return [text]
+
+    def fits(i, j):
+        bbox = _text_bbox(' '.join(words[i:j]), font)
+        return bbox[2] - bbox[0] <= max_width
+
+    # Advance widths are cheap and close to the rendered width, so a bisect over
+    # their running sum lands on (or next to) each greedy line break; the exact
+    # bbox check then only has to nudge the cut by a word or two.
+    space = font.getlength(' ')
+    cum = list(accumulate((font.getlength(w) + space for w in words), initial=0.0))
+
     lines = []
-    current_line = []
+    i, n = 0, len(words)
+    while i < n:
+        j = bisect_right(cum, cum[i] + max_width + space, i + 1) - 1
+        j = min(max(j, i + 1), n)
+        while j > i + 1 and not fits(i, j):
+            j -= 1
+        while j < n and fits(i, j + 1):
+            j += 1
+        lines.append(' '.join(words[i:j]))
+        i = j
 
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        bbox = draw.textbbox((0, 0), test_line, font=font)
-        if bbox[2] - bbox[0] <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
+    return lines
 
-    if current_line:
-        lines.append(' '.join(current_line))
 
-    return lines if lines else [text]
+@lru_cache(maxsize=32)
+def _rounded_bg(w: int, h: int, radius: int) -> Image.Image:
+    """Subtitle background tile: the rounded box [0, 0, w, h] on a transparent (w+1)x(h+1) image."""
+    tile = Image.new('RGBA', (w + 1, h + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).rounded_rectangle([0, 0, w, h], radius=radius, fill=(0, 0, 0, 180))
+    return tile
 
 
 def draw_subtitle(img: Image.Image, text: str, font_size: int, text_color: tuple, y_position: int) -> Image.Image:
-    """Draw subtitle text with background on image, auto-wrapping long text."""
-    draw = ImageDraw.Draw(img)
+    """Draw subtitle text with background on an opaque RGBA image, auto-wrapping long text.
+
+    Draws in place and returns img; pass a copy if the original must be kept.
+    """
+    tile, mask, dest = _prepare_subtitle(text, img.width, img.height, font_size, text_color, y_position)
+    # Over an opaque frame, a masked paste of the opaque tile is the same blend
+    # as alpha_composite, done in one pass over just the subtitle region
+    img.paste(tile, dest, mask)
+    return img
+
+
+@lru_cache(maxsize=256)
+def _prepare_subtitle(text: str, width: int, height: int, font_size: int, text_color: tuple,
+                      y_position: int) -> tuple[Image.Image, Image.Image, tuple[int, int]]:
+    """Pre-render a subtitle (box and text) as an opaque tile, its coverage mask, and its (x, y).
+
+    A subtitle stays on screen for many frames, so its layout and rasterization
+    happen once; each frame is then a single masked paste of the tile.
+    """
     font = get_font(font_size)
 
     # Max width is 90% of image width
-    max_width = int(img.width * 0.9)
+    max_width = int(width * 0.9)
     padding = 12
     line_spacing = 6
 
     # Wrap text to fit
-    lines = wrap_text(text, font, max_width, draw)
+    lines = wrap_text(text, font, max_width, None)
 
     # Calculate total height
     line_heights = []
     line_widths = []
     for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=font)
+        bbox = _text_bbox(line, font)
         line_widths.append(bbox[2] - bbox[0])
         line_heights.append(bbox[3] - bbox[1])
 
@@ -75,31 +247,45 @@ def draw_subtitle(img: Image.Image, text: str, font_size: int, text_color: tuple
     max_line_width = max(line_widths)
 
     # Adjust y_position so subtitle doesn't go off screen
-    y = min(y_position, img.height - total_height - padding * 2 - 10)
+    y = min(y_position, height - total_height - padding * 2 - 10)
 
     # Background box
-    bg_x = (img.width - max_line_width) // 2 - padding
+    bg_x = (width - max_line_width) // 2 - padding
     bg_box = [bg_x, y - padding, bg_x + max_line_width + padding * 2, y + total_height + padding]
 
-    # Create overlay for semi-transparent background
-    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    overlay_draw.rounded_rectangle(bg_box, radius=10, fill=(0, 0, 0, 180))
-
-    # Composite
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-    img = Image.alpha_composite(img, overlay)
-
-    # Draw each line centered
-    draw = ImageDraw.Draw(img)
+    # Line positions, centered
+    positions = []
     current_y = y
     for i, line in enumerate(lines):
-        line_x = (img.width - line_widths[i]) // 2
-        draw.text((line_x, current_y), line, font=font, fill=text_color)
+        positions.append(((width - line_widths[i]) // 2, current_y))
         current_y += line_heights[i] + line_spacing
 
-    return img
+    # Tile covers the box and all text, clipped to the frame
+    x0, y0, x1, y1 = bg_box[0], bg_box[1], bg_box[2] + 1, bg_box[3] + 1
+    for line, (lx, ly) in zip(lines, positions):
+        bbox = _text_bbox(line, font)
+        x0, y0 = min(x0, lx + bbox[0]), min(y0, ly + bbox[1])
+        x1, y1 = max(x1, lx + bbox[2]), max(y1, ly + bbox[3])
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = max(min(x1, width), x0 + 1), max(min(y1, height), y0 + 1)
+
+    tile = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+    # Semi-transparent background
+    tile.paste(_rounded_bg(bg_box[2] - bg_box[0], bg_box[3] - bg_box[1], 10), (bg_box[0] - x0, bg_box[1] - y0))
+
+    # Text as a solid-color layer with glyph coverage as alpha, composited over
+    # the box; drawing straight onto the translucent tile would darken glyph edges
+    coverage = Image.new('L', tile.size, 0)
+    draw = ImageDraw.Draw(coverage)
+    for line, (lx, ly) in zip(lines, positions):
+        draw.text((lx - x0, ly - y0), line, font=font, fill=text_color[3] if len(text_color) > 3 else 255)
+    text_layer = Image.new('RGBA', tile.size, tuple(text_color[:3]) + (0,))
+    text_layer.putalpha(coverage)
+    tile.alpha_composite(text_layer)
+
+    mask = tile.getchannel('A')
+    tile.putalpha(255)
+    return tile, mask, (x0, y0)
 
 
 def load_avatar(path: str, size: int) -> Image.Image:
@@ -114,28 +300,27 @@ def load_avatar(path: str, size: int) -> Image.Image:
     # Resize to target size
     img = img.resize((size, size), Image.Resampling.LANCZOS)
 
-    # Create anti-aliased circular mask at higher resolution
-    scale = 4  # Supersampling factor
-    mask_size = size * scale
-    mask = Image.new('L', (mask_size, mask_size), 0)
-    from PIL import ImageDraw
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, mask_size - 1, mask_size - 1], fill=255)
-    # Downsample for anti-aliasing
-    mask = mask.resize((size, size), Image.Resampling.LANCZOS)
-
     # Apply mask to avatar
     output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     output.paste(img, (0, 0))
-    output.putalpha(mask)
+    output.putalpha(_circle_mask(size))
 
     return output
 
 
+@lru_cache(maxsize=8)
+def _circle_mask(size: int) -> Image.Image:
+    """Anti-aliased circular L mask: a one-pixel alpha ramp across the rim."""
+    r = size / 2
+    y, x = np.ogrid[:size, :size]
+    d = np.sqrt((x - r + 0.5) ** 2 + (y - r + 0.5) ** 2)
+    mask = np.clip((r - d) * 255 + 127.5, 0, 255).astype(np.uint8)
+    return Image.fromarray(mask, 'L')
+
+
 def is_video_file(path: str) -> bool:
     """Check if file is a video based on extension."""
-    video_exts = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'}
-    return Path(path).suffix.lower() in video_exts
+    return Path(path).suffix.lower() in _VIDEO_EXTS
 
 
 def get_video_frame_count(video_path: str, fps: int) -> int:
@@ -153,37 +338,99 @@ def get_video_frame_count(video_path: str, fps: int) -> int:
     return 0
 
 
-def extract_video_frames(video_path: str, width: int, height: int, fps: int, max_frames: int):
-    """Extract frames from video file, yielding PIL Images. Uses cover/fill scaling."""
+# Decoded frames extract_video_frames keeps buffered ahead of the caller
+_PREFETCH_FRAMES = 8
+# Rendered frames render_video queues for its encoder writer thread
+_WRITE_QUEUE_FRAMES = 8
+
+
+def extract_video_frames(video_path: str, width: int, height: int, fps: int, max_frames: int,
+                         threads: int = 0):
+    """Extract frames from video file, yielding RGBA PIL Images. Uses cover/fill scaling.
+
+    A reader thread keeps up to _PREFETCH_FRAMES decoded frames ready, so
+    ffmpeg and the caller's compositing overlap. Frames are views onto a
+    small pool of recycled read buffers: each is only valid until the next
+    frame is requested, so callers that keep a frame must copy it.
+    threads sets the decoder thread count (0 = one per CPU core).
+    """
     cmd = [
-        'ffmpeg', '-i', video_path,
+        'ffmpeg',
+        # Frame- and slice-threaded software decoding
+        '-threads', str(threads if threads > 0 else cpu_count()),
+        '-thread_type', 'frame+slice',
+        '-i', video_path,
         '-vf', f'scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}',
         '-r', str(fps),
         '-f', 'rawvideo',
-        '-pix_fmt', 'rgb24',
+        # RGBA so PIL can wrap the buffer without copying (packed RGB can't be mapped)
+        '-pix_fmt', 'rgba',
         '-frames:v', str(max_frames),
         '-'
     ]
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-    frame_size = width * height * 3
+    frame_size = width * height * 4
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               bufsize=max(frame_size, 1 << 20))
+    _enlarge_pipe(process.stdout)
+
+    # Buffers cycle free -> reader (filled) -> caller -> free; the pool size
+    # bounds how far the reader can run ahead
+    free, filled = Queue(), Queue()
+    for _ in range(_PREFETCH_FRAMES):
+        free.put(bytearray(frame_size))
+    reader = threading.Thread(target=_read_frames,
+                              args=(process.stdout, frame_size, max_frames, free, filled),
+                              daemon=True)
+    reader.start()
 
-    frames_read = 0
-    while frames_read < max_frames:
-        raw = process.stdout.read(frame_size)
-        if len(raw) < frame_size:
+    try:
+        while (raw := filled.get()) is not None:
+            yield Image.frombuffer('RGBA', (width, height), raw, 'raw', 'RGBA', 0, 1)
+            free.put(raw)
+    finally:
+        # Unblock the reader if it is waiting for a buffer (caller stopped early)
+        free.put(None)
+        reader.join()
+        process.stdout.close()
+        process.wait()
+
+
+def _write_frames(pipe, frames: Queue):
+    """Writer thread for render_video: drain frames into the encoder pipe until None.
+
+    Frames go straight to the pipe's file descriptor, bypassing Python's
+    buffered I/O, so each one costs as few write syscalls as the pipe allows.
+    """
+    fd = pipe.fileno()
+    broken = False
+    while (data := frames.get()) is not None:
+        if broken:
+            continue
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except OSError:
+            # Encoder exited early; keep draining so the renderer never blocks,
+            # and let its exit code report the failure
+            broken = True
+
+
+def _read_frames(stdout, frame_size: int, max_frames: int, free: Queue, filled: Queue):
+    """Reader thread for extract_video_frames: fill free buffers from stdout, None-terminated."""
+    for _ in range(max_frames):
+        raw = free.get()
+        if raw is None or stdout.readinto(raw) < frame_size:
             break
-        frame = Image.frombytes('RGB', (width, height), raw)
-        yield frame
-        frames_read += 1
-
-    process.stdout.close()
-    process.wait()
+        filled.put(raw)
+    filled.put(None)
 
 
+@_memoize_wrap
 def smart_wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, draw: ImageDraw.Draw) -> list[str]:
     """Wrap text with smarter line breaking - prefer breaks after punctuation, avoid orphans."""
     # First check if text fits on one line
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = _text_bbox(text, font)
     if bbox[2] - bbox[0] <= max_width:
         return [text]
 
@@ -199,7 +446,7 @@ def smart_wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, dra
         if word[-1] in punctuation:
             # Test if first part fits
             first_part = ' '.join(words[:i+1])
-            bbox = draw.textbbox((0, 0), first_part, font=font)
+            bbox = _text_bbox(first_part, font)
             if bbox[2] - bbox[0] <= max_width:
                 best_break = i + 1
 
@@ -208,7 +455,7 @@ def smart_wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, dra
         line1 = ' '.join(words[:best_break])
         line2 = ' '.join(words[best_break:])
         # Check if line2 fits, otherwise wrap it too
-        bbox = draw.textbbox((0, 0), line2, font=font)
+        bbox = _text_bbox(line2, font)
         if bbox[2] - bbox[0] <= max_width:
             return [line1, line2]
         else:
@@ -223,8 +470,8 @@ def smart_wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, dra
     for i in range(max(1, mid - 2), min(len(words) - 1, mid + 3)):
         part1 = ' '.join(words[:i])
         part2 = ' '.join(words[i:])
-        bbox1 = draw.textbbox((0, 0), part1, font=font)
-        bbox2 = draw.textbbox((0, 0), part2, font=font)
+        bbox1 = _text_bbox(part1, font)
+        bbox2 = _text_bbox(part2, font)
         w1, w2 = bbox1[2] - bbox1[0], bbox2[2] - bbox2[0]
         if w1 <= max_width and w2 <= max_width:
             diff = abs(w1 - w2)
@@ -236,8 +483,8 @@ def smart_wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int, dra
     line2 = ' '.join(words[best_split:])
 
     # Verify both fit
-    bbox1 = draw.textbbox((0, 0), line1, font=font)
-    bbox2 = draw.textbbox((0, 0), line2, font=font)
+    bbox1 = _text_bbox(line1, font)
+    bbox2 = _text_bbox(line2, font)
 
     if bbox1[2] - bbox1[0] > max_width:
         return wrap_text(text, font, max_width, draw)
@@ -255,22 +502,50 @@ def draw_intro_title(img: Image.Image, title: str, font_path: str, width: int, h
     Args:
         animations: dict with 'title' and 'subtitle' Animation objects
     """
-    from .animations import AnimationState, intro_title_animation
+    # Work on a copy so img itself is left untouched
+    img = img.convert('RGBA') if img.mode != 'RGBA' else img.copy()
+    overlay, dest = build_intro_overlay(title, font_path, width, height, title_color, subtitle,
+                                        frame_idx=frame_idx, fps=fps, animations=animations)
+    img.alpha_composite(overlay, dest)
+    return img
 
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
 
-    # Get animation states
-    time = frame_idx / fps
-    if animations is None:
-        animations = intro_title_animation()
-
-    title_state = animations.get('title', None)
-    subtitle_state = animations.get('subtitle', None)
+@dataclass(frozen=True)
+class IntroLayout:
+    """Frame-invariant intro title layout, measured at the base (unscaled) font sizes."""
+    title: str
+    subtitle: str | None
+    font_path: str
+    width: int
+    height: int
+    base_text_color: tuple[int, int, int]
+    base_shadow_color: tuple[int, int, int]
+    luminance: float
+    base_font_size: int
+    subtitle_base_font_size: int
+    lines: tuple[str, ...]
+    base_line_widths: tuple[int, ...]
+    base_line_heights: tuple[int, ...]
+    base_subtitle_width: int
+    base_subtitle_height: int
+    base_start_y: int
+    line_spacing: int = 10
+    subtitle_gap: int = 60
+
+
+@lru_cache(maxsize=128)
+def _load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Cached ImageFont.truetype, falling back to get_font if the file can't be loaded."""
+    try:
+        return ImageFont.truetype(font_path, size)
+    except (OSError, IOError):
+        return get_font(size)
 
-    title_anim = title_state.get_state(time, fps) if title_state else AnimationState()
-    sub_anim = subtitle_state.get_state(time, fps) if subtitle_state else AnimationState()
 
+@lru_cache(maxsize=8)
+def _prepare_intro_layout(title: str, font_path: str, width: int, height: int,
+                          title_color: str, subtitle: str | None) -> IntroLayout:
+    """Compute everything about the intro title that doesn't change per frame."""
     # Parse title color
     color_hex = title_color.lstrip('#')
     base_text_color = tuple(int(color_hex[i:i+2], 16) for i in (0, 2, 4))
@@ -282,56 +557,30 @@ def draw_intro_title(img: Image.Image, title: str, font_path: str, width: int, h
     # Calculate font size based on image dimensions
     base_font_size = max(48, width // 15)
     subtitle_base_font_size = int(base_font_size * 0.5)
-
-    # Apply scale to font size for title
-    font_size = int(base_font_size * title_anim.scale)
-    subtitle_font_size = int(subtitle_base_font_size * sub_anim.scale)
-
-    try:
-        font = ImageFont.truetype(font_path, font_size)
-        subtitle_font = ImageFont.truetype(font_path, subtitle_font_size)
-        # Also load base size fonts for layout calculation
-        base_font = ImageFont.truetype(font_path, base_font_size)
-        base_subtitle_font = ImageFont.truetype(font_path, subtitle_base_font_size)
-    except (OSError, IOError):
-        font = get_font(font_size)
-        subtitle_font = get_font(subtitle_font_size)
-        base_font = get_font(base_font_size)
-        base_subtitle_font = get_font(subtitle_base_font_size)
-
-    # Create overlay for compositing with opacity
-    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    base_font = _load_font(font_path, base_font_size)
+    base_subtitle_font = _load_font(font_path, subtitle_base_font_size)
 
     # Wrap title text with smart wrapping (use base font for consistent layout)
     max_width = int(width * 0.8)
-    lines = smart_wrap_text(title, base_font, max_width, draw)
+    lines = smart_wrap_text(title, base_font, max_width)
 
     # Calculate title height using BASE font (for consistent positioning)
     base_line_heights = []
     base_line_widths = []
     for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=base_font)
+        bbox = _text_bbox(line, base_font)
         base_line_widths.append(bbox[2] - bbox[0])
         base_line_heights.append(bbox[3] - bbox[1])
 
-    # Calculate ACTUAL line dimensions with scaled font
-    line_heights = []
-    line_widths = []
-    for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=font)
-        line_widths.append(bbox[2] - bbox[0])
-        line_heights.append(bbox[3] - bbox[1])
-
-    line_spacing = 10
+    line_spacing = IntroLayout.line_spacing
+    subtitle_gap = IntroLayout.subtitle_gap
     base_title_height = sum(base_line_heights) + line_spacing * (len(lines) - 1)
 
     # Calculate subtitle dimensions if provided (base size)
     base_subtitle_height = 0
     base_subtitle_width = 0
-    subtitle_gap = 60
     if subtitle:
-        bbox = draw.textbbox((0, 0), subtitle, font=base_subtitle_font)
+        bbox = _text_bbox(subtitle, base_subtitle_font)
         base_subtitle_width = bbox[2] - bbox[0]
         base_subtitle_height = bbox[3] - bbox[1]
 
@@ -340,77 +589,373 @@ def draw_intro_title(img: Image.Image, title: str, font_path: str, width: int, h
     if subtitle:
         total_height += subtitle_gap + base_subtitle_height
 
-    # Center vertically (base position)
-    base_start_y = (height - total_height) // 2
+    return IntroLayout(
+        title=title,
+        subtitle=subtitle,
+        font_path=font_path,
+        width=width,
+        height=height,
+        base_text_color=base_text_color,
+        base_shadow_color=base_shadow_color,
+        luminance=luminance,
+        base_font_size=base_font_size,
+        subtitle_base_font_size=subtitle_base_font_size,
+        lines=tuple(lines),
+        base_line_widths=tuple(base_line_widths),
+        base_line_heights=tuple(base_line_heights),
+        base_subtitle_width=base_subtitle_width,
+        base_subtitle_height=base_subtitle_height,
+        # Center vertically (base position)
+        base_start_y=(height - total_height) // 2,
+    )
 
-    # Apply title opacity to colors
+
+@lru_cache(maxsize=256)
+def _glyph_mask(text: str, font: ImageFont.FreeTypeFont) -> tuple[Image.Image, tuple[int, int]]:
+    """Coverage mask of text as drawn at (0, 0), and the offset of its top-left corner."""
+    bbox = _text_bbox(text, font)
+    mask = Image.new('L', (max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+    return mask, (bbox[0], bbox[1])
+
+
+def build_intro_overlay(title: str, font_path: str, width: int, height: int,
+                        title_color: str = '#ffffff', subtitle: str = None,
+                        frame_idx: int = 0, fps: int = 30,
+                        animations: dict = None) -> tuple[Image.Image, tuple[int, int]]:
+    """Transparent RGBA overlay holding the intro title/subtitle for one frame.
+
+    The overlay only covers the text band; it is returned together with the
+    (x, y) position it belongs at in the full frame. The image is shared
+    through a cache and must not be modified.
+    """
+    from .animations import AnimationState, intro_title_animation
+
+    # Get animation states
+    if animations is None:
+        animations = intro_title_animation()
+
+    title_state = animations.get('title', None)
+    subtitle_state = animations.get('subtitle', None)
+
+    title_anim = title_state.state_at(frame_idx, fps) if title_state else AnimationState()
+    sub_anim = subtitle_state.state_at(frame_idx, fps) if subtitle_state else AnimationState()
+
+    layout = _prepare_intro_layout(title, font_path, width, height, title_color, subtitle)
+
+    # Reduce each animation state to the integers the drawing actually uses;
+    # frames that agree on all of them share one cached overlay
     title_opacity = int(255 * title_anim.opacity)
-    text_color = base_text_color + (title_opacity,)
-    shadow_opacity = int(180 * title_anim.opacity) if luminance > 0.5 else int(120 * title_anim.opacity)
-    shadow_color = base_shadow_color + (shadow_opacity,)
+    shadow_opacity = int(180 * title_anim.opacity) if layout.luminance > 0.5 else int(120 * title_anim.opacity)
+    title_params = (int(layout.base_font_size * title_anim.scale), int(title_anim.offset_x),
+                    int(title_anim.offset_y), title_opacity, shadow_opacity)
+    sub_params = None
+    if subtitle:
+        sub_params = (int(layout.subtitle_base_font_size * sub_anim.scale), int(sub_anim.offset_x),
+                      int(sub_anim.offset_y), int(255 * 0.7 * sub_anim.opacity),
+                      int(shadow_opacity * sub_anim.opacity))
+
+    return _draw_intro_frame(layout, title_params, sub_params)
+
+
+@lru_cache(maxsize=64)
+def _draw_intro_frame(layout: IntroLayout, title_params: tuple,
+                      sub_params: tuple | None) -> tuple[Image.Image, tuple[int, int]]:
+    """Draw the title (and subtitle) for one animation state onto a text-band overlay."""
+    font_size, title_dx, title_dy, title_opacity, shadow_opacity = title_params
+    font = _load_font(layout.font_path, font_size)
+
+    # (x, y, text, font, fill) in full-frame coordinates, in drawing order
+    placements = []
+
+    # Apply title opacity to colors
+    text_color = layout.base_text_color + (title_opacity,)
+    shadow_color = layout.base_shadow_color + (shadow_opacity,)
 
     # Draw title lines centered with shadow
-    current_base_y = base_start_y
-    for i, line in enumerate(lines):
+    current_base_y = layout.base_start_y
+    for line, base_w, base_h in zip(layout.lines, layout.base_line_widths, layout.base_line_heights):
+        # Actual line dimensions with the scaled font
+        bbox = _text_bbox(line, font)
+        line_w = bbox[2] - bbox[0]
+        line_h = bbox[3] - bbox[1]
+
         # Calculate base center position
-        base_line_x = (width - base_line_widths[i]) // 2
+        base_line_x = (layout.width - base_w) // 2
         base_line_y = current_base_y
 
         # Adjust for scale (center the scaled text on the base position)
-        scale_offset_x = (line_widths[i] - base_line_widths[i]) // 2
-        scale_offset_y = (line_heights[i] - base_line_heights[i]) // 2
+        scale_offset_x = (line_w - base_w) // 2
+        scale_offset_y = (line_h - base_h) // 2
 
-        line_x = base_line_x - scale_offset_x + int(title_anim.offset_x)
-        line_y = base_line_y - scale_offset_y + int(title_anim.offset_y)
+        line_x = base_line_x - scale_offset_x + title_dx
+        line_y = base_line_y - scale_offset_y + title_dy
 
         # Shadow
-        draw.text((line_x + 2, line_y + 2), line, font=font, fill=shadow_color)
+        placements.append((line_x + 2, line_y + 2, line, font, shadow_color))
         # Main text
-        draw.text((line_x, line_y), line, font=font, fill=text_color)
+        placements.append((line_x, line_y, line, font, text_color))
 
-        current_base_y += base_line_heights[i] + line_spacing
+        current_base_y += base_h + layout.line_spacing
 
     # Draw subtitle if provided
-    if subtitle:
+    if layout.subtitle:
+        sub_font_size, sub_dx, sub_dy, sub_opacity, sub_shadow_opacity = sub_params
+        subtitle_font = _load_font(layout.font_path, sub_font_size)
+
         # Apply subtitle opacity
-        sub_opacity = int(255 * 0.7 * sub_anim.opacity)
-        subtitle_color = tuple(int(c * 0.7) for c in base_text_color) + (sub_opacity,)
-        sub_shadow_opacity = int(shadow_opacity * sub_anim.opacity)
-        sub_shadow_color = base_shadow_color + (sub_shadow_opacity,)
+        subtitle_color = tuple(int(c * 0.7) for c in layout.base_text_color) + (sub_opacity,)
+        sub_shadow_color = layout.base_shadow_color + (sub_shadow_opacity,)
 
         # Get actual subtitle dimensions
-        bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
+        bbox = _text_bbox(layout.subtitle, subtitle_font)
         actual_sub_width = bbox[2] - bbox[0]
         actual_sub_height = bbox[3] - bbox[1]
 
         # Base position
-        base_subtitle_y = current_base_y + subtitle_gap - line_spacing
-        base_subtitle_x = (width - base_subtitle_width) // 2
+        base_subtitle_y = current_base_y + layout.subtitle_gap - layout.line_spacing
+        base_subtitle_x = (layout.width - layout.base_subtitle_width) // 2
 
         # Adjust for scale
-        scale_offset_x = (actual_sub_width - base_subtitle_width) // 2
-        scale_offset_y = (actual_sub_height - base_subtitle_height) // 2
+        scale_offset_x = (actual_sub_width - layout.base_subtitle_width) // 2
+        scale_offset_y = (actual_sub_height - layout.base_subtitle_height) // 2
 
-        subtitle_x = base_subtitle_x - scale_offset_x + int(sub_anim.offset_x)
-        subtitle_y = base_subtitle_y - scale_offset_y + int(sub_anim.offset_y)
+        subtitle_x = base_subtitle_x - scale_offset_x + sub_dx
+        subtitle_y = base_subtitle_y - scale_offset_y + sub_dy
 
         # Shadow
-        draw.text((subtitle_x + 1, subtitle_y + 1), subtitle, font=subtitle_font, fill=sub_shadow_color)
+        placements.append((subtitle_x + 1, subtitle_y + 1, layout.subtitle, subtitle_font, sub_shadow_color))
         # Main text
-        draw.text((subtitle_x, subtitle_y), subtitle, font=subtitle_font, fill=subtitle_color)
+        placements.append((subtitle_x, subtitle_y, layout.subtitle, subtitle_font, subtitle_color))
+
+    # Size the overlay to the union of the text boxes, clipped to the frame
+    x0, y0, x1, y1 = layout.width, layout.height, 0, 0
+    for x, y, text, text_font, _ in placements:
+        bbox = _text_bbox(text, text_font)
+        x0 = min(x0, x + bbox[0])
+        y0 = min(y0, y + bbox[1])
+        x1 = max(x1, x + bbox[2])
+        y1 = max(y1, y + bbox[3])
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(max(x1, x0 + 1), layout.width), min(max(y1, y0 + 1), layout.height)
+    x0, y0 = min(x0, x1 - 1), min(y0, y1 - 1)
+
+    # Shadow and main text share one rasterized glyph mask; each is a solid-color paste
+    overlay = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+    for x, y, text, text_font, fill in placements:
+        mask, (mx, my) = _glyph_mask(text, text_font)
+        overlay.paste(fill, (x - x0 + mx, y - y0 + my), mask)
+
+    return overlay, (x0, y0)
 
-    # Composite overlay onto image
-    img = Image.alpha_composite(img, overlay)
-    return img
+
+class _Throttle:
+    """Rate limiter for progress reports: due() is True at most once per interval seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._last = float('-inf')
+
+    def due(self) -> bool:
+        now = time.monotonic()
+        if now - self._last < self.interval:
+            return False
+        self._last = now
+        return True
+
+
+class _IntroFrames:
+    """Intro clip frames held as rows of one contiguous (N, H, W, 4) uint8 array.
+
+    Runs of identical consecutive frames share a row. Rows past the last
+    distinct frame are never written, so their pages are never committed.
+    """
+
+    def __init__(self, count: int, width: int, height: int):
+        self.pixels = np.empty((count, height, width, 4), dtype=np.uint8)
+        self.rows = np.zeros(count, dtype=np.intp)  # frame index -> row of pixels
+        self._frames = 0
+        self._distinct = 0
+
+    def __len__(self) -> int:
+        return self._frames
+
+    def append(self, frame):
+        """Add a new distinct frame (RGBA Image or packed RGBA bytes)."""
+        row = self.pixels[self._distinct]
+        if isinstance(frame, Image.Image):
+            row[...] = np.asarray(frame)
+        else:
+            row.reshape(-1)[...] = np.frombuffer(frame, dtype=np.uint8)
+        self.rows[self._frames] = self._distinct
+        self._distinct += 1
+        self._frames += 1
+
+    def repeat(self):
+        """Add a frame identical to the previous one (black if there is none)."""
+        if not self._distinct:
+            self.pixels[0] = 0
+            self._distinct = 1
+        self.rows[self._frames] = self.rows[self._frames - 1] if self._frames else 0
+        self._frames += 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.pixels[self.rows[i]]
+
+    def image(self, i: int) -> Image.Image:
+        """Read-only RGBA view of frame i; PIL copies it on first write."""
+        return Image.fromarray(self[i], 'RGBA')
 
 
 def blend_frames(frame1: Image.Image, frame2: Image.Image, alpha: float) -> Image.Image:
-    """Blend two frames together. alpha=0 is all frame1, alpha=1 is all frame2."""
-    if frame1.mode != 'RGBA':
-        frame1 = frame1.convert('RGBA')
-    if frame2.mode != 'RGBA':
-        frame2 = frame2.convert('RGBA')
-    return Image.blend(frame1, frame2, alpha)
+    """Blend two RGBA frames (images or (H, W, 4) arrays). alpha=0 is all frame1, alpha=1 is all frame2."""
+    # Fixed-point lerp with an 8-bit weight keeps the whole blend in integer ufuncs
+    weight = int(round(alpha * 256))
+    a = np.asarray(frame1).astype(np.int32)
+    b = np.asarray(frame2).astype(np.int32)
+    out = a + (((b - a) * weight) >> 8)
+    return Image.fromarray(out.astype(np.uint8), 'RGBA')
+
+
+# Per-process render context for worker processes, set once by _init_frame_worker
+_FRAME_CTX: dict = {}
+# Shared memory segments the worker's context views into; kept open for its lifetime
+_ATTACHED_SHM: list = []
+
+
+@dataclass(frozen=True)
+class _SharedRef:
+    """Picklable stand-in for an array or image whose bytes live in shared memory."""
+    name: str
+    shape: tuple
+    dtype: str = ''
+    mode: str = ''
+
+
+def _share_value(value, segments: list):
+    """Copy large arrays and images (also inside dicts) into shared memory segments."""
+    if isinstance(value, dict):
+        return {k: _share_value(v, segments) for k, v in value.items()}
+    if isinstance(value, np.ndarray) and value.nbytes:
+        shm = SharedMemory(create=True, size=value.nbytes)
+        segments.append(shm)
+        np.ndarray(value.shape, value.dtype, buffer=shm.buf)[...] = value
+        return _SharedRef(shm.name, value.shape, dtype=value.dtype.str)
+    if isinstance(value, Image.Image):
+        data = value.tobytes()
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        segments.append(shm)
+        shm.buf[:len(data)] = data
+        return _SharedRef(shm.name, value.size, mode=value.mode)
+    return value
+
+
+def _attach_value(value):
+    """Inverse of _share_value, run in the worker: rebuild zero-copy views."""
+    if isinstance(value, dict):
+        return {k: _attach_value(v) for k, v in value.items()}
+    if not isinstance(value, _SharedRef):
+        return value
+    shm = SharedMemory(name=value.name)
+    _ATTACHED_SHM.append(shm)
+    if value.mode:
+        # Read-only view; PIL copies on first write
+        return Image.frombuffer(value.mode, value.shape, shm.buf, 'raw', value.mode, 0, 1)
+    array = np.ndarray(value.shape, np.dtype(value.dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return array
+
+
+@contextmanager
+def _shared_context(ctx: dict):
+    """Yield ctx with its arrays/images moved to shared memory for Pool workers.
+
+    Workers attach to the segments instead of each unpickling their own copy
+    of the background and audio features. Segments are released on exit.
+    """
+    segments = []
+    try:
+        yield _share_value(ctx, segments)
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _imap_bounded(pool, func, items, window: int):
+    """Ordered pool.imap that keeps at most window tasks in flight.
+
+    pool.imap hands every task to the workers at once and holds finished
+    results in this process until they are read, so behind a slow consumer
+    (the encoder) it would buffer up to the whole output.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(func, (item,)))
+    while pending:
+        yield pending.popleft().get()
+
+
+def _init_frame_worker(ctx: dict):
+    """Pool initializer: keep the shared, read-only render context in the worker."""
+    global _FRAME_CTX
+    _FRAME_CTX = _attach_value(ctx)
+
+
+def _intro_band(ctx: dict, frame_idx: int) -> tuple[Image.Image, tuple[int, int]]:
+    """Cached (overlay, dest) text band of the animated intro for frame_idx."""
+    return build_intro_overlay(
+        ctx['title'], ctx['font'], ctx['width'], ctx['height'], ctx['title_color'], ctx['subtitle'],
+        frame_idx=frame_idx, fps=ctx['fps'], animations=ctx['animations']
+    )
+
+
+def _composite_intro_band(ctx: dict, band: tuple[Image.Image, tuple[int, int]]) -> Image.Image:
+    overlay, dest = band
+    frame = ctx['background'].copy()
+    frame.alpha_composite(overlay, dest)
+    return frame
+
+
+def _render_intro_frame(ctx: dict, frame_idx: int) -> Image.Image:
+    """Composite the animated intro title for frame_idx onto the intro background."""
+    return _composite_intro_band(ctx, _intro_band(ctx, frame_idx))
+
+
+def _render_intro_frame_worker(frame_idx: int) -> bytes:
+    return _render_intro_frame(_FRAME_CTX, frame_idx).tobytes()
+
+
+def _render_main_frame(ctx: dict, i: int) -> bytes:
+    """Render main (post-intro) frame i to packed RGBA bytes."""
+    data_idx = int(ctx['data_of_frame'][i])
+
+    # One RGBA canvas per process, redrawn every frame; each frame is
+    # serialized to bytes before the next one reuses it
+    canvas = ctx.get('canvas')
+    if canvas is None:
+        canvas = ctx['canvas'] = Image.new('RGBA', ctx['background'].size)
+    frame = ctx['visualizer'].render_frame(ctx['background'], ctx['frame_data'], data_idx, out=canvas)
+
+    # Overlay avatar at center
+    avatar = ctx['avatar']
+    if avatar:
+        frame.paste(avatar, ctx['avatar_pos'], ctx['avatar_mask'])
+
+    # Draw subtitle if active (O(1) lookup)
+    sub_idx = ctx['subtitle_of_frame'][i]
+    if sub_idx >= 0:
+        frame = draw_subtitle(frame, ctx['subtitle_texts'][sub_idx], ctx['subtitle_font_size'],
+                              ctx['sub_color'], ctx['subtitle_y'])
+
+    # RGBA goes to the encoder pipe as-is
+    return frame.tobytes()
+
+
+def _render_main_frame_worker(i: int) -> bytes:
+    return _render_main_frame(_FRAME_CTX, i)
 
 
 def render_video(
@@ -448,9 +993,20 @@ def render_video(
     preset: str = 'ultrafast',
     threads: int = 0,
     wave_sync: float = 0.0,
+    workers: int = 0,
+    hw_encoder: str = 'none',
     progress_callback=None
 ):
-    """Render audio visualization video."""
+    """Render audio visualization video.
+
+    workers sets how many processes rasterize animated intro and main frames (0 = one per CPU,
+    1 = render in this process). Visualizers that keep per-frame state
+    always render in this process.
+
+    hw_encoder selects a hardware H.264 encoder ('nvenc', 'qsv', 'videotoolbox'),
+    'auto' to use the first one that works here, or 'none' for libx264 (preset
+    then applies). An unavailable encoder falls back to libx264.
+    """
 
     # Load and analyze audio
     if progress_callback:
@@ -465,11 +1021,12 @@ def render_video(
     bands = get_frequency_bands(y, sr, fps, n_bands=64)
     waveform = get_waveform_chunks(y, sr, fps, samples_per_frame=200)
 
-    # Ensure all arrays have same length
+    # Ensure all arrays have same length, stored contiguous float32 so each
+    # per-frame row read by the visualizers is one compact slice
     n_frames = min(len(amplitude), len(bands), len(waveform))
-    amplitude = amplitude[:n_frames]
-    bands = bands[:n_frames]
-    waveform = waveform[:n_frames]
+    amplitude = np.ascontiguousarray(amplitude[:n_frames], dtype=np.float32)
+    bands = np.ascontiguousarray(bands[:n_frames], dtype=np.float32)
+    waveform = np.ascontiguousarray(waveform[:n_frames], dtype=np.float32)
 
     frame_data = {
         'amplitude': amplitude,
@@ -479,6 +1036,10 @@ def render_video(
 
     # Setup visualizer and background
     background = get_background(width, height, bg_type, bg_value)
+    # Every frame is composited in RGBA; converting the shared background once
+    # means visualizer output, blends and subtitles never need a per-frame convert
+    if background.mode != 'RGBA':
+        background = background.convert('RGBA')
     visualizer_class = get_visualizer(style)
     # Pass avatar_size to radial visualizer so it can align with avatar
     if style == 'radial' and avatar_path:
@@ -503,8 +1064,11 @@ def render_video(
     sub_color_hex = subtitle_color.lstrip('#')
     sub_color = tuple(int(sub_color_hex[i:i+2], 16) for i in (0, 2, 4)) + (255,)
 
+    # Worker processes for the per-frame phases (0 = one per CPU)
+    n_workers = workers if workers > 0 else cpu_count()
+
     # Prepare intro clip if title is provided
-    intro_clip_frames_list = []
+    intro_frames = _IntroFrames(0, width, height)
     intro_clip_frame_count = 0
     fade_duration_frames = int(fps * 0.5)  # 0.5 second fade transition
 
@@ -524,6 +1088,10 @@ def render_video(
                 subtitle_delay=0.3,
                 subtitle_duration=0.5
             )
+        intro_frames = _IntroFrames(intro_clip_frame_count, width, height)
+        # Bake the whole intro timeline up front; frames then read states by index
+        for anim in intro_animations.values():
+            anim.bake(intro_clip_frame_count, fps)
 
         # Load intro avatar if provided (for static mode)
         intro_avatar_img = None
@@ -545,65 +1113,148 @@ def render_video(
                 if intro_avatar_img:
                     ax_intro = (width - intro_avatar_img.width) // 2
                     ay_intro = height // 4 - intro_avatar_img.height // 2  # Upper area
-                    if intro_frame.mode != 'RGBA':
-                        intro_frame = intro_frame.convert('RGBA')
                     intro_frame.paste(intro_avatar_img, (ax_intro, ay_intro), intro_avatar_img)
-                intro_clip_frames_list.append(intro_frame)
+                intro_frames.append(intro_frame)
                 frame_idx += 1
             # If video is shorter than needed, repeat last frame
-            while len(intro_clip_frames_list) < intro_clip_frame_count:
-                intro_clip_frames_list.append(intro_clip_frames_list[-1].copy() if intro_clip_frames_list else None)
+            while len(intro_frames) < intro_clip_frame_count:
+                intro_frames.repeat()
         else:
             # Static image background
             if intro_bg:
                 intro_bg_img = Image.open(intro_bg).convert('RGBA')
                 intro_bg_img = intro_bg_img.resize((width, height), Image.Resampling.LANCZOS)
             else:
-                # Use main background as fallback
-                intro_bg_img = background.copy()
-                if intro_bg_img.mode != 'RGBA':
-                    intro_bg_img = intro_bg_img.convert('RGBA')
+                # Use main background as fallback (already RGBA; never modified in place)
+                intro_bg_img = background
 
             if intro_static:
                 # Static mode: generate one frame and repeat
                 intro_frame = draw_intro_title(
-                    intro_bg_img.copy(), intro_title, intro_font, width, height, intro_title_color, intro_subtitle,
+                    intro_bg_img, intro_title, intro_font, width, height, intro_title_color, intro_subtitle,
                     frame_idx=999, fps=fps, animations=intro_animations
                 )
                 # Add avatar for static intro
                 if intro_avatar_img:
                     ax_intro = (width - intro_avatar_img.width) // 2
                     ay_intro = height // 4 - intro_avatar_img.height // 2
-                    if intro_frame.mode != 'RGBA':
-                        intro_frame = intro_frame.convert('RGBA')
                     intro_frame.paste(intro_avatar_img, (ax_intro, ay_intro), intro_avatar_img)
-                intro_clip_frames_list = [intro_frame] * intro_clip_frame_count
+                intro_frames.append(intro_frame)
+                for _ in range(intro_clip_frame_count - 1):
+                    intro_frames.repeat()
             else:
                 # Animated mode: generate each frame
-                for frame_idx in range(intro_clip_frame_count):
-                    bg_copy = intro_bg_img.copy()
-                    intro_frame = draw_intro_title(
-                        bg_copy, intro_title, intro_font, width, height, intro_title_color, intro_subtitle,
-                        frame_idx=frame_idx, fps=fps, animations=intro_animations
-                    )
-                    intro_clip_frames_list.append(intro_frame)
+                # Only the text band is composited; the rest is a plain copy of the background.
+                # Frames depend only on their index, so they render across worker processes.
+                intro_ctx = {
+                    'background': intro_bg_img,
+                    'title': intro_title,
+                    'subtitle': intro_subtitle,
+                    'font': intro_font,
+                    'title_color': intro_title_color,
+                    'width': width,
+                    'height': height,
+                    'fps': fps,
+                    'animations': intro_animations,
+                }
+                # Once the animation settles, consecutive frames come out identical;
+                # those share the previous row instead of each storing a fresh copy.
+                intro_indices = range(intro_clip_frame_count)
+                if n_workers > 1 and intro_clip_frame_count > 1:
+                    prev_data = None
+                    with _shared_context(intro_ctx) as shared_ctx, \
+                            Pool(n_workers, initializer=_init_frame_worker, initargs=(shared_ctx,)) as pool:
+                        for data in pool.imap(_render_intro_frame_worker, intro_indices, chunksize=4):
+                            if data != prev_data:
+                                prev_data = data
+                                intro_frames.append(data)
+                            else:
+                                intro_frames.repeat()
+                else:
+                    prev_band = None
+                    for frame_idx in intro_indices:
+                        band = _intro_band(intro_ctx, frame_idx)
+                        if band is not prev_band:
+                            prev_band = band
+                            intro_frames.append(_composite_intro_band(intro_ctx, band))
+                        else:
+                            intro_frames.repeat()
 
     # Calculate total frames
     # Main audio starts immediately after intro clip ends
-    # End screen is concatenated separately (not rendered frame by frame)
+    # End screen is concatenated by the encoder (not rendered frame by frame)
     end_screen_sec = end_screen_duration if end_screen else 0
     total_frames = intro_clip_frame_count + n_frames
 
     if progress_callback:
-        progress_callback(f"Rendering {total_frames} frames...")
+        progress_callback(f"Rendering {total_frames} frames{' (Pillow-SIMD)' if PILLOW_SIMD else ''}...")
+
+    # Pre-compute avatar position
+    ax = ay = None
+    if avatar:
+        ax = (width - avatar.width) // 2
+        ay = (height - avatar.height) // 2
+
+    # Visualizers that never draw over the avatar's circle get it composited
+    # into the background once, instead of pasted on top of every frame
+    frame_background, frame_avatar = background, avatar
+    if avatar and visualizer.leaves_center_clear(max(avatar.width, avatar.height) / 2):
+        frame_background = background.copy()
+        frame_background.paste(avatar, (ax, ay), avatar)
+        frame_avatar = None
+
+    # Avatars pasted per frame go in opaque through the L circle mask: the same
+    # colors as pasting through their own alpha, with a cheaper mask path and
+    # without leaving the canvas translucent along the rim
+    frame_avatar_mask = None
+    if frame_avatar:
+        frame_avatar_mask = _circle_mask(frame_avatar.width)
+        frame_avatar = frame_avatar.copy()
+        frame_avatar.putalpha(255)
+
+    # Generate thumbnail from intro frame after animation completes
+    if thumbnail:
+        if progress_callback:
+            progress_callback(f"Generating thumbnail: {thumbnail}")
+        if len(intro_frames):
+            # Use frame after animation completes (around 2 seconds in, or last frame if shorter)
+            thumb_idx = min(int(fps * 2), len(intro_frames) - 1)
+            thumb_frame = intro_frames.image(thumb_idx).copy()
+        else:
+            # Generate first waveform frame
+            thumb_frame = visualizer.render_frame(frame_background, frame_data, 0)
+            if frame_avatar:
+                thumb_frame.paste(frame_avatar, (ax, ay), frame_avatar_mask)
+        if thumb_frame.mode != 'RGB':
+            thumb_frame = thumb_frame.convert('RGB')
+        thumb_frame.save(thumbnail, quality=95)
+
+    # The end screen template joins the main video inside the encoder's filtergraph
+    template_path = None
+    if end_screen:
+        template_path = Path(__file__).parent / "templates" / f"end_screen_{width}x{height}.mp4"
+        if not template_path.exists():
+            if progress_callback:
+                progress_callback(f"Warning: End screen template not found for {width}x{height}")
+            template_path = None
+        elif not _video_decodes(template_path):
+            # A broken template would fail the whole encode; render without it
+            if progress_callback:
+                progress_callback("Warning: Could not add end screen")
+            template_path = None
 
     # Setup FFmpeg pipe
+    encode_threads = threads if threads > 0 else cpu_count()
     ffmpeg_cmd = [
         'ffmpeg', '-y',
+        # Global: thread counts for the audio mix filtergraph
+        '-filter_threads', str(encode_threads),
+        '-filter_complex_threads', str(encode_threads),
         '-f', 'rawvideo',
         '-vcodec', 'rawvideo',
         '-s', f'{width}x{height}',
-        '-pix_fmt', 'rgb24',
+        # Frames are RGBA throughout, so they are piped without a per-frame RGB conversion
+        '-pix_fmt', 'rgba',
         '-r', str(fps),
         '-i', '-',
         '-i', input_audio,
@@ -631,16 +1282,36 @@ def render_video(
         bg_music_idx = input_idx
         input_idx += 1
 
-    ffmpeg_cmd.extend([
-        '-c:v', 'libx264',
-        '-preset', preset,
-        '-tune', 'animation',    # Better for generated content
-        '-crf', '23',
-    ])
+    end_screen_idx = None
+    if template_path:
+        ffmpeg_cmd.extend(['-i', str(template_path)])
+        end_screen_idx = input_idx
+        input_idx += 1
 
-    # Add thread control if specified
-    if threads > 0:
-        ffmpeg_cmd.extend(['-threads', str(threads)])
+    # Cover art rides along as a second, stream-copied video stream
+    cover_idx = None
+    if thumbnail and os.path.exists(thumbnail):
+        ffmpeg_cmd.extend(['-i', thumbnail])
+        cover_idx = input_idx
+        input_idx += 1
+
+    encoder = _resolve_hw_encoder(hw_encoder, progress_callback)
+    if encoder:
+        if progress_callback:
+            progress_callback(f"Hardware encoder: {encoder}")
+        encoder_args, pix_fmt = _HW_ENCODERS[encoder]
+        ffmpeg_cmd.extend(encoder_args)
+    else:
+        pix_fmt = 'yuv420p'
+        ffmpeg_cmd.extend([
+            '-c:v:0', 'libx264',
+            '-preset', preset,
+            '-tune', 'animation',    # Better for generated content
+            '-crf', '23',
+        ])
+
+    # Encoder threads (0 = one per CPU core)
+    ffmpeg_cmd.extend(['-threads', str(encode_threads)])
 
     # Build audio filter
     # Strategy:
@@ -663,9 +1334,14 @@ def render_video(
     # End screen duration is configurable
     total_video_duration = main_duration_sec + (intro_clip_duration if intro_title else 0) + end_screen_sec
 
-    if intro_sound or outro_sound or intro_title or bg_music:
-        filter_parts = []
+    filter_parts = []
+    video_map = '0:v'
+    if end_screen_idx is not None:
+        # Main video audio already has outro extending into end screen duration
+        filter_parts.append(f'[0:v]setsar=1[mainv];[{end_screen_idx}:v]fps={fps},setsar=1[endv];[mainv][endv]concat=n=2:v=1:a=0[outv]')
+        video_map = '[outv]'
 
+    if intro_sound or outro_sound or intro_title or bg_music:
         # Timeline:
         # 0s: Intro clip starts, intro music starts
         # intro_clip_duration: Intro clip ends, waveform starts, main audio starts
@@ -742,18 +1418,35 @@ def render_video(
             # No bg music: apply final compressor
             filter_parts.append(f'[{current_mix}]acompressor=threshold=-20dB:ratio=4:attack=5:release=50[aout]')
 
-        ffmpeg_cmd.extend(['-filter_complex', ';'.join(filter_parts), '-map', '0:v', '-map', '[aout]'])
-    elif volume != 100:
-        ffmpeg_cmd.extend(['-af', f'volume={volume_factor}'])
+        audio_map = '[aout]'
+    else:
+        audio_map = '1:a'
+        if volume != 100:
+            ffmpeg_cmd.extend(['-af', f'volume={volume_factor}'])
+
+    if filter_parts:
+        ffmpeg_cmd.extend(['-filter_complex', ';'.join(filter_parts)])
+    if filter_parts or cover_idx is not None:
+        ffmpeg_cmd.extend(['-map', video_map, '-map', audio_map])
+    if cover_idx is not None:
+        ffmpeg_cmd.extend(['-map', f'{cover_idx}:v', '-c:v:1', 'copy', '-disposition:v:1', 'attached_pic'])
 
     ffmpeg_cmd.extend([
         '-c:a', 'aac',
         '-b:a', '192k',
-        '-pix_fmt', 'yuv420p',
+        '-pix_fmt:v:0', pix_fmt,
     ])
-    # Only use -shortest if no end_screen (otherwise we need audio to extend for outro)
-    if not end_screen:
-        ffmpeg_cmd.append('-shortest')
+    if end_screen_idx is not None:
+        # The outro mix runs past the end screen; stop the output with the video
+        ffmpeg_cmd.extend(['-t', f'{total_frames / fps + end_screen_sec:.3f}'])
+    elif not end_screen:
+        # Only use -shortest if no end_screen (otherwise we need audio to extend for outro).
+        # The one-frame cover stream would count as the shortest, so with a
+        # cover the output is cut to the video's length directly.
+        if cover_idx is not None:
+            ffmpeg_cmd.extend(['-t', f'{total_frames / fps:.3f}'])
+        else:
+            ffmpeg_cmd.append('-shortest')
     ffmpeg_cmd.append(output_video)
 
     # Debug: print ffmpeg command
@@ -764,104 +1457,128 @@ def render_video(
         ffmpeg_cmd,
         stdin=subprocess.PIPE,
         stdout=subprocess.DEVNULL,
-        stderr=subprocess.PIPE
+        stderr=subprocess.PIPE,
+        bufsize=0  # Written through its fd by _write_frames
     )
-
-    # Pre-compute avatar position
-    ax = ay = None
-    if avatar:
-        ax = (width - avatar.width) // 2
-        ay = (height - avatar.height) // 2
+    _enlarge_pipe(process.stdin)
 
     # Pre-build subtitle lookup table for O(1) access per frame
     # Subtitles sync with main audio which starts after intro clip
+    # Frame -> index into subtitle_texts, -1 where no subtitle is shown
     subtitle_offset_frames = intro_clip_frame_count
-    subtitle_lookup = {}
-    if subtitles:
-        for sub in subtitles:
-            start_frame = int(sub['start_ms'] * fps / 1000) + subtitle_offset_frames
-            end_frame = int(sub['end_ms'] * fps / 1000) + subtitle_offset_frames
-            for f in range(start_frame, end_frame + 1):
-                if f not in subtitle_lookup:  # First match wins
-                    subtitle_lookup[f] = sub['text']
-
-    # Generate thumbnail from intro frame after animation completes
-    if thumbnail:
-        if progress_callback:
-            progress_callback(f"Generating thumbnail: {thumbnail}")
-        if intro_clip_frames_list:
-            # Use frame after animation completes (around 2 seconds in, or last frame if shorter)
-            thumb_idx = min(int(fps * 2), len(intro_clip_frames_list) - 1)
-            thumb_frame = intro_clip_frames_list[thumb_idx].copy()
-        else:
-            # Generate first waveform frame
-            thumb_frame = visualizer.render_frame(background, frame_data, 0)
-            if avatar:
-                if thumb_frame.mode != 'RGBA':
-                    thumb_frame = thumb_frame.convert('RGBA')
-                thumb_frame.paste(avatar, (ax, ay), avatar)
-        if thumb_frame.mode != 'RGB':
-            thumb_frame = thumb_frame.convert('RGB')
-        thumb_frame.save(thumbnail, quality=95)
-
-    # Cache base frame with avatar for static backgrounds (non-video)
-    # This avoids re-compositing avatar on every frame
-    cached_base = None
-    use_cache = avatar and not is_video_file(bg_value) if bg_type == 'image' else avatar
+    subtitle_texts = [sub['text'] for sub in subtitles] if subtitles else []
+    subtitle_of_frame = np.full(total_frames, -1, dtype=np.int32)
+    for idx, sub in enumerate(subtitles or ()):
+        start_frame = max(int(sub['start_ms'] * fps / 1000) + subtitle_offset_frames, 0)
+        end_frame = min(int(sub['end_ms'] * fps / 1000) + subtitle_offset_frames, total_frames - 1)
+        span = subtitle_of_frame[start_frame:end_frame + 1]
+        span[span < 0] = idx  # First match wins
 
     # Render frames with optimizations
     report_interval = fps * 2  # Report every 2 seconds instead of every 1
+    # ...and at most a few times per wall-clock second however fast frames render
+    report_throttle = _Throttle(0.25)
+
+    # A writer thread feeds the encoder while the next frames render; the
+    # bounded queue caps how many encoded-but-unwritten frames are held
+    write_queue = Queue(maxsize=_WRITE_QUEUE_FRAMES)
+    writer = threading.Thread(target=_write_frames, args=(process.stdin, write_queue), daemon=True)
+    writer.start()
+
+    def emit(i: int, data: bytes):
+        write_queue.put(data)
+        if progress_callback and i % report_interval == 0 and report_throttle.due():
+            progress_callback(f"Frame {i}/{total_frames} ({i * 100 // total_frames}%)")
 
-    for i in range(total_frames):
-        # Determine which phase we're in
-        if intro_clip_frame_count > 0 and i < intro_clip_frame_count:
-            # Phase 1: Intro clip frames
-            intro_frame = intro_clip_frames_list[i]
-
-            # Check if we're in the fade transition zone (last fade_duration_frames of intro)
-            fade_start = intro_clip_frame_count - fade_duration_frames
-            if i >= fade_start:
-                # Blend intro frame with first waveform frame
-                fade_progress = (i - fade_start) / fade_duration_frames
-                waveform_frame = visualizer.render_frame(background, frame_data, 0)
-                if avatar:
-                    if waveform_frame.mode != 'RGBA':
-                        waveform_frame = waveform_frame.convert('RGBA')
-                    waveform_frame.paste(avatar, (ax, ay), avatar)
-                frame = blend_frames(intro_frame, waveform_frame, fade_progress)
-            else:
-                frame = intro_frame
+    def first_waveform_frame() -> Image.Image:
+        waveform_frame = visualizer.render_frame(frame_background, frame_data, 0)
+        if frame_avatar:
+            waveform_frame.paste(frame_avatar, (ax, ay), frame_avatar_mask)
+        return waveform_frame
+
+    # The fade target is the same for every fade frame unless the visualizer
+    # carries state from call to call, so render it once
+    fade_target = first_waveform_frame() if intro_clip_frame_count and visualizer.stateless else None
+
+    # Phase 1: Intro clip frames
+    for i in range(intro_clip_frame_count):
+        # Check if we're in the fade transition zone (last fade_duration_frames of intro)
+        fade_start = intro_clip_frame_count - fade_duration_frames
+        if i >= fade_start:
+            # Blend intro frame with first waveform frame (straight from the intro array)
+            fade_progress = (i - fade_start) / fade_duration_frames
+            waveform_frame = fade_target if fade_target is not None else first_waveform_frame()
+            frame = blend_frames(intro_frames[i], waveform_frame, fade_progress)
         else:
-            # Phase 2: Main waveform frames (after intro clip)
-            # Visualizer syncs with main audio - add small delay for better sync
-            # Visualizer frame = current frame - intro frames + sync offset
-            # Main audio starts at intro_clip_frame_count (delayed by intro_clip_duration in ffmpeg)
-            # wave_sync: positive = delay wave (wave behind audio), negative = advance wave (wave ahead of audio)
-            sync_offset_frames = int(wave_sync * fps)
-            data_idx = i - intro_clip_frame_count - sync_offset_frames
-            data_idx = max(0, min(data_idx, n_frames - 1))  # Clamp to valid range
-
-            frame = visualizer.render_frame(background, frame_data, data_idx)
-
-            # Overlay avatar at center
-            if avatar:
-                if frame.mode != 'RGBA':
-                    frame = frame.convert('RGBA')
-                frame.paste(avatar, (ax, ay), avatar)
+            # Read-only view: draw_subtitle's in-place drawing copies it first
+            frame = intro_frames.image(i)
 
         # Draw subtitle if active (O(1) lookup)
-        if i in subtitle_lookup:
-            frame = draw_subtitle(frame, subtitle_lookup[i], subtitle_font_size, sub_color, subtitle_y)
-
-        # Ensure RGB for output
-        if frame.mode != 'RGB':
-            frame = frame.convert('RGB')
-
-        process.stdin.write(frame.tobytes())
-
-        if progress_callback and i % report_interval == 0:
-            progress_callback(f"Frame {i}/{total_frames} ({i * 100 // total_frames}%)")
+        sub_idx = subtitle_of_frame[i]
+        if sub_idx >= 0:
+            frame = draw_subtitle(frame, subtitle_texts[sub_idx], subtitle_font_size, sub_color, subtitle_y)
+
+        # RGBA goes to the encoder pipe as-is
+        emit(i, frame.tobytes())
+
+    # Release the intro array (and any view into it) before the main phase,
+    # so it is neither held for the rest of the render nor inherited by workers
+    intro_frames = frame = None
+
+    # Frame -> frame_data row the visualizer draws, clamped at both ends
+    # Visualizer syncs with main audio - add small delay for better sync
+    # Visualizer frame = current frame - intro frames + sync offset
+    # Main audio starts at intro_clip_frame_count (delayed by intro_clip_duration in ffmpeg)
+    # wave_sync: positive = delay wave (wave behind audio), negative = advance wave (wave ahead of audio)
+    sync_offset_frames = int(wave_sync * fps)
+    data_of_frame = np.clip(np.arange(total_frames) - intro_clip_frame_count - sync_offset_frames,
+                            0, n_frames - 1).astype(np.int32)
+
+    # Phase 2: Main waveform frames (after intro clip). Each frame depends only
+    # on its index, so stateless visualizers render across worker processes.
+    # Results come back in order, with a couple of frames per worker in flight
+    # so rendering can never run far ahead of the encoder.
+    frame_ctx = {
+        'visualizer': visualizer,
+        'background': frame_background,
+        'frame_data': frame_data,
+        'data_of_frame': data_of_frame,
+        'avatar': frame_avatar,
+        'avatar_mask': frame_avatar_mask,
+        'avatar_pos': (ax, ay),
+        'subtitle_of_frame': subtitle_of_frame,
+        'subtitle_texts': subtitle_texts,
+        'subtitle_font_size': subtitle_font_size,
+        'sub_color': sub_color,
+        'subtitle_y': subtitle_y,
+    }
+    main_frames = range(intro_clip_frame_count, total_frames)
+
+    # Where the data index clamps (the wave_sync lead-in or tail) under an
+    # unchanged subtitle, a stateless visualizer draws the same frame again;
+    # only the first of each such run is rendered, the rest repeat its bytes
+    repeated = set()
+    if visualizer.stateless:
+        same = (data_of_frame[1:] == data_of_frame[:-1]) & (subtitle_of_frame[1:] == subtitle_of_frame[:-1])
+        repeated = set((np.flatnonzero(same[intro_clip_frame_count:]) + intro_clip_frame_count + 1).tolist())
+    fresh = [i for i in main_frames if i not in repeated] if repeated else main_frames
+
+    def emit_main(rendered):
+        data = None
+        for i in main_frames:
+            if i not in repeated:
+                data = next(rendered)
+            emit(i, data)
+
+    if n_workers > 1 and visualizer.stateless and len(fresh) > 1:
+        with _shared_context(frame_ctx) as shared_ctx, \
+                Pool(n_workers, initializer=_init_frame_worker, initargs=(shared_ctx,)) as pool:
+            emit_main(_imap_bounded(pool, _render_main_frame_worker, fresh, 2 * n_workers))
+    else:
+        emit_main(_render_main_frame(frame_ctx, i) for i in fresh)
 
+    write_queue.put(None)
+    writer.join()
     process.stdin.close()
     process.wait()
 
@@ -870,73 +1587,6 @@ def render_video(
             progress_callback("Error rendering video")
         return False, 0
 
-    # Concatenate end screen if enabled
-    if end_screen:
-        if progress_callback:
-            progress_callback("Adding end screen...")
-
-        # Find template for this resolution
-        templates_dir = Path(__file__).parent / "templates"
-        template_path = templates_dir / f"end_screen_{width}x{height}.mp4"
-
-        if template_path.exists():
-            # Temp output for concatenated video
-            temp_output = output_video + '.temp.mp4'
-
-            # Concat videos - main video audio already has outro extending into end screen duration
-            concat_cmd = [
-                'ffmpeg', '-y',
-                '-i', output_video,
-                '-i', str(template_path),
-                '-filter_complex',
-                f'[0:v][1:v]concat=n=2:v=1:a=0[outv]',
-                '-map', '[outv]', '-map', '0:a',
-                '-c:v', 'libx264', '-preset', 'fast', '-crf', '23',
-                '-c:a', 'copy',
-                '-pix_fmt', 'yuv420p',
-                '-shortest',
-                temp_output
-            ]
-            concat_result = subprocess.run(concat_cmd, capture_output=True)
-
-            if concat_result.returncode == 0:
-                # Replace original with concatenated
-                os.replace(temp_output, output_video)
-            else:
-                if progress_callback:
-                    progress_callback("Warning: Could not add end screen")
-                # Clean up temp file if it exists
-                if os.path.exists(temp_output):
-                    os.unlink(temp_output)
-        else:
-            if progress_callback:
-                progress_callback(f"Warning: End screen template not found for {width}x{height}")
-
-    # Embed thumbnail as MP4 cover art if provided
-    if thumbnail and os.path.exists(thumbnail):
-        if progress_callback:
-            progress_callback("Embedding cover image...")
-
-        temp_output = output_video + '.cover.mp4'
-        cover_cmd = [
-            'ffmpeg', '-y',
-            '-i', output_video,
-            '-i', thumbnail,
-            '-map', '0',
-            '-map', '1',
-            '-c', 'copy',
-            '-disposition:v:1', 'attached_pic',
-            temp_output
-        ]
-        cover_result = subprocess.run(cover_cmd, capture_output=True)
-
-        if cover_result.returncode == 0:
-            os.replace(temp_output, output_video)
-        else:
-            # Failed to embed, clean up
-            if os.path.exists(temp_output):
-                os.unlink(temp_output)
-
     if progress_callback:
         progress_callback("Done!")
 
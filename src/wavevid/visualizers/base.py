@@ -1,23 +1,62 @@
 """Base visualizer class."""
 from abc import ABC, abstractmethod
-from PIL import Image
+from PIL import Image, ImageDraw
 import numpy as np
 
 
 class BaseVisualizer(ABC):
     """Abstract base class for visualizers."""
 
+    # True when render_frame depends only on its arguments, so frames can be
+    # rendered out of order in worker processes. Visualizers that carry state
+    # from one frame to the next must set this to False.
+    stateless = True
+
     def __init__(self, width: int, height: int, wave_color: str):
         self.width = width
         self.height = height
         self.wave_color = self._hex_to_rgb(wave_color)
+        self._draw_cache = None
+
+    def __getstate__(self):
+        # The cached ImageDraw wraps a core image and cannot be pickled
+        state = self.__dict__.copy()
+        state['_draw_cache'] = None
+        return state
 
     def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
+    def leaves_center_clear(self, radius: float) -> bool:
+        """True if frames never draw within radius of the center.
+
+        Content there (the avatar) can then be composited into the background
+        once instead of on top of every frame.
+        """
+        return False
+
+    def _canvas(self, background: Image.Image, out: Image.Image | None) -> Image.Image:
+        """Image to draw a frame on: background copied into out if given, else a fresh copy."""
+        if out is None:
+            return background.copy()
+        out.paste(background, (0, 0))
+        return out
+
+    def _draw(self, img: Image.Image) -> ImageDraw.ImageDraw:
+        """ImageDraw for img, reused across frames while the same canvas is drawn on."""
+        cache = self._draw_cache
+        if cache is None or cache[0] is not img or cache[1] is not img.im:
+            cache = self._draw_cache = (img, img.im, ImageDraw.Draw(img))
+        return cache[2]
+
     @abstractmethod
-    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int) -> Image.Image:
-        """Render a single frame with visualization overlay."""
+    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int,
+                     out: Image.Image | None = None) -> Image.Image:
+        """Render a single frame with visualization overlay.
+
+        If out (same size and mode as background) is given, the frame is
+        drawn into it instead of a new image, and the result may be out.
+        """
         pass
@@ -8,6 +8,9 @@ from .base import BaseVisualizer
 class ParticlesVisualizer(BaseVisualizer):
     """Particles orbiting center, pulsing with audio amplitude."""
 
+    # Particle angles advance every frame
+    stateless = False
+
     def __init__(self, width: int, height: int, wave_color: str, **kwargs):
         super().__init__(width, height, wave_color)
         self.n_particles = 200
@@ -36,9 +39,10 @@ class ParticlesVisualizer(BaseVisualizer):
             })
         return particles
 
-    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int) -> Image.Image:
+    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int,
+                     out: Image.Image | None = None) -> Image.Image:
         """Render particle system for current frame."""
-        img = background.copy()
+        img = self._canvas(background, out)
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
 
@@ -96,5 +100,5 @@ class ParticlesVisualizer(BaseVisualizer):
                 ], fill=glow_color)
 
         # Composite overlay onto image
-        img = Image.alpha_composite(img, overlay)
+        img.alpha_composite(overlay)
         return img
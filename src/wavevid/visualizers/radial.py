@@ -1,5 +1,5 @@
 """Circular radial visualizer."""
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
 from .base import BaseVisualizer
 
@@ -11,10 +11,15 @@ class RadialVisualizer(BaseVisualizer):
         super().__init__(width, height, wave_color)
         self.avatar_size = avatar_size
 
-    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int) -> Image.Image:
+    def leaves_center_clear(self, radius: float) -> bool:
+        # Bars start at avatar_size / 2 + 10 and are 3px wide
+        return self.avatar_size is not None and radius <= self.avatar_size / 2 + 8
+
+    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int,
+                     out: Image.Image | None = None) -> Image.Image:
         """Render radial visualization for current frame."""
-        img = background.copy()
-        draw = ImageDraw.Draw(img)
+        img = self._canvas(background, out)
+        draw = self._draw(img)
 
         bands = frame_data['bands'][frame_idx]
         amplitude = frame_data['amplitude'][frame_idx]
@@ -1,5 +1,5 @@
 """Spectrum FFT analyzer visualizer with peak hold."""
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
 from .base import BaseVisualizer
 
@@ -7,15 +7,19 @@ from .base import BaseVisualizer
 class SpectrumVisualizer(BaseVisualizer):
     """FFT spectrum analyzer with gradient bars and peak indicators."""
 
+    # Peak hold decays from one frame to the next
+    stateless = False
+
     def __init__(self, width: int, height: int, wave_color: str, **kwargs):
         super().__init__(width, height, wave_color)
         self.peak_values = None
         self.peak_decay = 0.95  # Peak decay rate per frame
 
-    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int) -> Image.Image:
+    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int,
+                     out: Image.Image | None = None) -> Image.Image:
         """Render spectrum analyzer for current frame."""
-        img = background.copy()
-        draw = ImageDraw.Draw(img)
+        img = self._canvas(background, out)
+        draw = self._draw(img)
 
         bands = frame_data['bands'][frame_idx]
         amplitude = frame_data['amplitude'][frame_idx]
@@ -1,5 +1,5 @@
 """Classic horizontal waveform visualizer."""
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
 from .base import BaseVisualizer
 
@@ -7,10 +7,11 @@ from .base import BaseVisualizer
 class WaveformVisualizer(BaseVisualizer):
     """Horizontal amplitude waveform visualization."""
 
-    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int) -> Image.Image:
+    def render_frame(self, background: Image.Image, frame_data: dict, frame_idx: int,
+                     out: Image.Image | None = None) -> Image.Image:
         """Render waveform for current frame."""
-        img = background.copy()
-        draw = ImageDraw.Draw(img)
+        img = self._canvas(background, out)
+        draw = self._draw(img)
 
         waveform = frame_data['waveform'][frame_idx]
         amplitude = frame_data['amplitude'][frame_idx]